@@ -1,5 +1,6 @@
 from __future__ import annotations
-import ast, sys
+import ast, os, re, sys
+from collections import deque
 from pathlib import Path
 import mkdocs_gen_files  # only if you’re using mkdocs-gen-files
 
@@ -25,19 +26,45 @@ SKIP_DIRS = {
 SKIP_EXTS = {".egg-info", ".deb", ".pyc", ".secrets"}  # treat as dirs too
 SKIP_FILES = {"uv.lock", ".env"}
 
+# Precomputed predicates so each entry needs a single set lookup / regex match
+_SKIP_ANY = frozenset(SKIP_FILES)
+_SKIP_DIR_NAMES = frozenset(SKIP_DIRS | SKIP_FILES)
+_SKIP_DIR_EXT = re.compile("(?:" + "|".join(map(re.escape, SKIP_EXTS)) + ")$")
+
 EMOJI_DIR = "📁 "
 INDENT = "│   "
 ELBOW = "└── "
 TEE = "├── "
 
 
+# Comments and blank lines allowed before a module docstring
+LEADING = re.compile(r"(?:\s|#[^\n]*(?:\n|$))*")
+DOC_OPEN = re.compile(r"[rRuU]?(\"\"\"|\'\'\')")
+HEAD_SIZE = 4096
+STR_PREFIXES = {p + q for p in "rRuUbBfF" for q in "\"'"}
+
+
 def first_docline(pyfile: Path) -> str | None:
     if pyfile.suffix != ".py":
         return None
     try:
-        ds = ast.get_docstring(
-            ast.parse(pyfile.read_text(encoding="utf-8", errors="ignore"))
-        )
+        with pyfile.open(encoding="utf-8", errors="ignore") as f:
+            head = f.read(HEAD_SIZE)
+        # The module docstring, if any, is at the top of the file so reading the
+        # head is enough. Fall back to parsing the whole file only when the head
+        # is inconclusive (docstring cut off, escapes, unusual quoting).
+        pos = LEADING.match(head).end()
+        if pos == len(head):
+            if len(head) < HEAD_SIZE:
+                return None
+        elif m := DOC_OPEN.match(head, pos):
+            end = head.find(m.group(1), m.end())
+            ds = head[m.end() : end]
+            if end != -1 and "\\" not in ds:
+                return ds.strip().splitlines()[0].strip() if ds.strip() else None
+        elif head[pos] not in "'\"" and head[pos : pos + 2] not in STR_PREFIXES:
+            return None
+        ds = ast.get_docstring(ast.parse(pyfile.read_text("utf-8", "ignore")))
         return ds.strip().splitlines()[0].strip() if ds else None
     except Exception:
         return None
@@ -48,38 +75,59 @@ def annotate(path: Path) -> str:
     return f"  # {line}" if line else ""
 
 
+def _list_entries(d: str | Path) -> list[os.DirEntry[str]]:
+    # DirEntry caches the file type reported by the OS, avoiding a stat per check
+    skip_any, skip_dir_names, skip_dir_ext = _SKIP_ANY, _SKIP_DIR_NAMES, _SKIP_DIR_EXT
+    with os.scandir(d) as it:
+        entries = [
+            e
+            for e in it
+            if not (
+                e.name in skip_any
+                or (
+                    e.is_dir()
+                    and (e.name in skip_dir_names or skip_dir_ext.search(e.name))
+                )
+            )
+        ]
+
+    entries.sort(key=lambda x: (x.is_file(), x.name.lower()))
+    return entries
+
+
 def build_tree(root: Path, max_depth: int = 10) -> list[str]:
-    lines = [f"{EMOJI_DIR}{root.name}/"]
-
-    def walk(d: Path, prefix: str, depth: int):
-        if depth < 0:
-            return
-        entries = []
-        for e in d.iterdir():
-            if e.name in SKIP_FILES:
-                continue
-            if e.is_dir():
-                if (
-                    e.name in SKIP_DIRS
-                    or e.suffix in SKIP_EXTS
-                    or e.name.endswith(".egg-info")
-                ):
-                    continue
-            entries.append(e)
-
-        entries.sort(key=lambda x: (x.is_file(), x.name.lower()))
-
-        for i, e in enumerate(entries):
-            connector = ELBOW if i == len(entries) - 1 else TEE
-            if e.is_dir():
-                lines.append(f"{prefix}{connector} {EMOJI_DIR}{e.name}/")
-                walk(
-                    e, prefix + (INDENT if i != len(entries) - 1 else "    "), depth - 1
+    # Local aliases avoid global lookups inside the loop
+    emoji_dir, indent, elbow, tee = EMOJI_DIR, INDENT, ELBOW, TEE
+    list_entries = _list_entries
+    lines = [f"{emoji_dir}{root.name}/"]
+    append = lines.append
+
+    # Depth-first traversal with an explicit stack of (entries, position, prefix,
+    # depth) frames instead of recursion
+    stack = deque([(list_entries(root), 0, "", max_depth)])
+    while stack:
+        entries, i, prefix, depth = stack.pop()
+        if i >= len(entries):
+            continue
+        stack.append((entries, i + 1, prefix, depth))
+
+        e = entries[i]
+        last = i == len(entries) - 1
+        connector = elbow if last else tee
+        if e.is_dir():
+            append(f"{prefix}{connector} {emoji_dir}{e.name}/")
+            if depth > 0:
+                stack.append(
+                    (
+                        list_entries(e.path),
+                        0,
+                        prefix + ("    " if last else indent),
+                        depth - 1,
+                    )
                 )
-            else:
-                lines.append(f"{prefix}{connector} {e.name}{annotate(e)}")
+        else:
+            append(f"{prefix}{connector} {e.name}{annotate(Path(e.path))}")
 
-    walk(root, "", max_depth)
     return lines
 
 
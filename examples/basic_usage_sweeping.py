@@ -5,11 +5,18 @@ This demo script follows a typical usage of the library that showcases the sweep
 mode functions that can be used on COMET lasers.
 """
 
+from __future__ import annotations
+
 import logging
+import os
+from math import inf
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from pychilaslasers import Laser
-from pychilaslasers.comm import list_comports
+# The library is imported where it is first needed, so importing this module (e.g.
+# to reuse its helpers) stays cheap
+if TYPE_CHECKING:
+    from pychilaslasers import Laser
 
 # Path to *.csv file, which contains the calibration Look-Up Table (lut)
 path_calibration_lut = Path("path/to/file")
@@ -21,25 +28,46 @@ logger = logging.getLogger(__name__)
 
 
 def select_com_port() -> str:
-    if len(ports := list_comports()) == 1:
-        selected_com_port: str = ports[0]
-    elif len(ports) < 0:
+    # Set PYCHILAS_COM to the laser's port to skip (potentially slow) port discovery
+    if selected_com_port := os.environ.get("PYCHILAS_COM"):
+        return selected_com_port
+
+    from pychilaslasers.comm import list_comports
+
+    ports: list[str] = list_comports()
+    if not ports:
         print("No COM ports found. Please connect the laser and try again.")
         exit(1)
-    else:
-        while True:
-            selected_com_port = input(
-                f"Available COM ports: {ports}\nPlease enter the COM port address: "
-            )
-            if selected_com_port in ports:
-                break
-            print("Invalid COM port address. Please choose from.")
-    return selected_com_port
+    if len(ports) == 1:
+        return ports[0]
+
+    while True:
+        selected_com_port = input(
+            f"Available COM ports: {ports}\nPlease enter the COM port address: "
+        )
+        if selected_com_port in ports:
+            return selected_com_port
+        print("Invalid COM port address. Please choose from.")
+
+
+def prompt_float(message: str, low: float = -inf, high: float = inf) -> float:
+    # Ask until the user enters a number within [low, high]
+    while True:
+        try:
+            value = float(input(message))
+        except ValueError:
+            print("Please enter a number.")
+            continue
+        if low <= value <= high:
+            return value
+        print(f"Please enter a value between {low} and {high}.")
 
 
 def run_sweeping_example(laser: Laser | None = None) -> None:
     # Continue with the sweeping example using the laser object
     if laser is None:
+        from pychilaslasers import Laser
+
         laser = Laser(calibration_file=path_calibration_lut, com_port=select_com_port())
 
     # Turn on laser system
@@ -65,8 +93,13 @@ def run_sweeping_example(laser: Laser | None = None) -> None:
     print(
         f"Please define sweep wavelength bounds. Maximum start is {start_wavelength} nm, minimum end is {end_wavelength} nm"
     )
-    start_wavelength = float(input("Enter the start wavelength (nm): "))
-    end_wavelength = float(input("Enter the end wavelength (nm): "))
+    min_wavelength, max_wavelength = end_wavelength, start_wavelength
+    start_wavelength = prompt_float(
+        "Enter the start wavelength (nm): ", min_wavelength, max_wavelength
+    )
+    end_wavelength = prompt_float(
+        "Enter the end wavelength (nm): ", min_wavelength, start_wavelength
+    )
 
     try:
         laser.sweep.set_range(start_wavelength, end_wavelength)
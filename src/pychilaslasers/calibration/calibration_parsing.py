@@ -6,6 +6,7 @@ Functions:
 
 import logging
 from csv import reader
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, TextIO
 
@@ -125,7 +126,7 @@ def _parse_defaults_block(
     if not settings == {}:  # Warn about extra parameters
         for param in settings.keys():
             logging.getLogger(__name__).warning(
-                f"Invalid param {param} found in calibration data"
+                "Invalid param %s found in calibration data", param
             )
 
     return model, serial, tune, sweep
@@ -164,24 +165,26 @@ def _parse_rows(f: TextIO, model: str) -> list[CalibrationEntry]:
     """
     csv_reader = reader(f, delimiter=";")
     entries: list[CalibrationEntry] = []
+    append = entries.append
 
+    is_comet = model == "COMET"
     no_expected_columns = 5 if model == "ATLAS" else 6
     cycler_index = 0
     mode_index = 1
     in_hop = False
+    hop_flag: bool = False
 
     for row in csv_reader:
-        hop_flag: bool = False
-        if not row or all(not c for c in row):
+        if not any(row):
             continue
         # normalize row length if trailing semicolons are missing
         if len(row) < no_expected_columns:
             # You could raise here if the file is malformed
             raise CalibrationError("Incorrect file format, missing columns!")
 
-        if model == "COMET":
+        if is_comet:
             # hop flag as bool
-            hop_flag = int(float(str(row[5]).strip())) == 1
+            hop_flag = int(float(row[5])) == 1  # float() ignores whitespace
 
             if in_hop and not hop_flag:
                 in_hop = False
@@ -189,17 +192,16 @@ def _parse_rows(f: TextIO, model: str) -> list[CalibrationEntry]:
                 in_hop = True
                 mode_index += 1
 
-        wl = float(row[4])
-        ps, lr, sr, cp = (float(row[0]), float(row[1]), float(row[2]), float(row[3]))
+        ps, lr, sr, cp, wl = map(float, row[:5])
 
-        entries.append(
+        append(
             CalibrationEntry(
                 wavelength=wl,
                 phase_section=ps,
                 large_ring=lr,
                 small_ring=sr,
                 coupler=cp,
-                mode_index=mode_index if model == "COMET" else None,
+                mode_index=mode_index if is_comet else None,
                 mode_hop_flag=hop_flag,
                 cycler_index=cycler_index,
             )
@@ -212,7 +214,8 @@ def _parse_rows(f: TextIO, model: str) -> list[CalibrationEntry]:
 def load_calibration(file_path: str | Path) -> Calibration:
     """Load and parse a laser calibration file into a Calibration object.
 
-    This function is the main entry point for loading calibration data.
+    This function is the main entry point for loading calibration data. Every
+    call parses the file and returns a new Calibration object.
 
     Args:
         file_path: Path to the calibration file (CSV format with semicolon
@@ -227,7 +230,53 @@ def load_calibration(file_path: str | Path) -> Calibration:
         CalibrationError: If the file format is invalid or contains
             incomplete data.
     """
+    return _parse_calibration(Path(file_path))
+
+
+def _load_shared_calibration(file_path: str | Path) -> Calibration:
+    """Load a calibration file for a `Laser`, reusing earlier parses of the file.
+
+    Parsed files are cached for the lifetime of the process, keyed on the resolved
+    path, modification time and size of the file, so creating another `Laser` with
+    the same unchanged file does not parse it a second time. The returned object
+    is shared between all callers and must not be modified, which is why the
+    cache is not used by `load_calibration`.
+
+    Args:
+        file_path: Path to the calibration file.
+
+    Returns:
+        The shared Calibration object of the file.
+    """
     file_path = Path(file_path)
+    try:
+        path = file_path.resolve()
+        stat = path.stat()
+    except OSError:
+        # Let opening the file report the problem
+        return _parse_calibration(file_path)
+    return _load_cached(path, stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=8)
+def _load_cached(path: Path, mtime_ns: int, size: int) -> Calibration:
+    """Parse a calibration file, caching the result per file version.
+
+    The modification time and size are not used directly but are part of the
+    cache key, so a file that changed on disk is parsed again.
+    """
+    return _parse_calibration(path)
+
+
+def _parse_calibration(file_path: Path) -> Calibration:
+    """Parse a calibration file into a Calibration object.
+
+    Args:
+        file_path: Path to the calibration file.
+
+    Returns:
+        The parsed Calibration object.
+    """
     entries: list[CalibrationEntry] = []
 
     model: str
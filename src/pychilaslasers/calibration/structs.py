@@ -13,22 +13,23 @@ Authors: SDU
 # ⚛️ Type checking
 from __future__ import annotations
 from enum import Enum
-from itertools import pairwise
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from collections.abc import Iterator
 
 # ✅ Standard library imports
+from bisect import bisect_left
 import logging
 from dataclasses import dataclass, field
+from operator import sub
 from typing import overload
 
 # ✅ Local imports
 from pychilaslasers.exceptions.calibration_error import CalibrationError
 
 
-@dataclass
+@dataclass(slots=True)
 class CalibrationEntry:
     """Represents a single calibration data entry for a specific wavelength.
 
@@ -164,6 +165,7 @@ class Calibration:
     Attributes:
         model: Laser model identifier ("ATLAS" or "COMET").
         entries: Complete list of calibration entries in file order.
+        wavelengths: Wavelength of every entry, in the same order as `entries`.
         min_wl: Minimum wavelength in the calibration range.
         max_wl: Maximum wavelength in the calibration range.
         precision: The maximum number of decimals an entry can have after the "."
@@ -175,7 +177,11 @@ class Calibration:
     model: str
     serial_number: str | None
     _direct_access: dict[float, CalibrationEntry]
+    _sorted_wavelengths: list[float]
+    _file_order: dict[float, int]
+    _mode_hop_starts: dict[float, CalibrationEntry]
     entries: list[CalibrationEntry]
+    wavelengths: list[float]
     min_wl: float
     max_wl: float
     precision: int
@@ -210,15 +216,17 @@ class Calibration:
         self.sweep_settings = sweep_settings
         if entries == []:
             raise CalibrationError("Empty calibration received!")
-        _wavelengths: list[float] = [entry.wavelength for entry in entries]
-        self.max_wl = max(_wavelengths)
-        self.min_wl = min(_wavelengths)
+        self.wavelengths = [entry.wavelength for entry in entries]
+        self.max_wl = max(self.wavelengths)
+        self.min_wl = min(self.wavelengths)
+        # Number of decimals, partition yields "" if there are none
         self.precision = max(
-            len(s.split(".")[1]) if "." in s else 0 for s in map(str, _wavelengths)
+            len(s.partition(".")[2]) for s in map(str, self.wavelengths)
         )
 
         try:
-            self.step_size = min([x - y for x, y in pairwise(_wavelengths)])
+            # Smallest difference between consecutive entries
+            self.step_size = min(map(sub, self.wavelengths, self.wavelengths[1:]))
         except IndexError:
             logging.getLogger(__name__).warning(
                 "Calibration loaded with less than 2 entries"
@@ -227,6 +235,15 @@ class Calibration:
         self._direct_access = {
             entry.wavelength: entry for entry in entries if not entry.mode_hop_flag
         }
+        # Sorted copy of the wavelengths for closest-match lookups by bisection. The
+        # file order is kept to resolve ties the same way a linear search would.
+        self._sorted_wavelengths = sorted(self._direct_access)
+        self._file_order = {wl: i for i, wl in enumerate(self._direct_access)}
+        # First entry of the mode hop procedure for every wavelength that has one
+        self._mode_hop_starts = {}
+        for entry in entries:
+            if entry.mode_hop_flag:
+                self._mode_hop_starts.setdefault(entry.wavelength, entry)
 
     def get_mode_hop_start(self, wavelength: float) -> CalibrationEntry:
         """Get the calibration entry at the start of a mode hop procedure.
@@ -244,16 +261,38 @@ class Calibration:
                 `__getitem__`.
 
         """
-        wavelength = self[wavelength].wavelength
-        mode_hops: list[CalibrationEntry] = [
-            entry
-            for entry in self.entries
-            if entry.wavelength == wavelength and entry.mode_hop_flag
-        ]
-        if mode_hops:
-            return mode_hops[0]
-        else:
-            return self[wavelength]
+        entry: CalibrationEntry = self[wavelength]
+        return self._mode_hop_starts.get(entry.wavelength, entry)
+
+    def neighbour(self, wavelength: float, direction: float) -> float:
+        """Get the calibrated wavelength next to a wavelength.
+
+        Mode hop entries are not considered, so the result can always be tuned to
+        directly.
+
+        Args:
+            wavelength: Wavelength in nanometers to step from. If it is not in the
+                calibration table, the closest available wavelength is used.
+            direction: Positive to step to the next higher wavelength, zero or
+                negative to step to the next lower one.
+
+        Returns:
+            The neighbouring wavelength in nanometers.
+
+        Raises:
+            KeyError: If wavelength is outside the calibration range.
+            ValueError: If there is no calibrated wavelength beyond wavelength in
+                the given direction.
+        """
+        wavelengths: list[float] = self._sorted_wavelengths
+        index: int = bisect_left(wavelengths, self[wavelength].wavelength)
+        index += 1 if direction > 0 else -1
+        # Checked here, as a negative index would wrap around to the other end
+        if not 0 <= index < len(wavelengths):
+            raise ValueError(
+                f"No calibration entry beyond {wavelength} nm in that direction."
+            )
+        return wavelengths[index]
 
     def __getitem__(self, wavelength: float) -> CalibrationEntry:
         """Get calibration entry for a specific wavelength.
@@ -271,12 +310,24 @@ class Calibration:
         Raises:
             KeyError: If wavelength is outside the calibration range.
         """
-        if wavelength in self._direct_access:
-            return self._direct_access[wavelength]
+        if (entry := self._direct_access.get(wavelength)) is not None:
+            return entry
         elif wavelength in self:
-            return self._direct_access[
-                min(self._direct_access.keys(), key=lambda x: abs(x - wavelength))
-            ]
+            # The closest wavelength is one of the two neighbours of the insertion point
+            wavelengths: list[float] = self._sorted_wavelengths
+            i: int = bisect_left(wavelengths, wavelength)
+            if i == 0:
+                closest: float = wavelengths[0]
+            elif i == len(wavelengths):
+                closest = wavelengths[-1]
+            else:
+                below, above = wavelengths[i - 1], wavelengths[i]
+                diff_below, diff_above = wavelength - below, above - wavelength
+                if diff_below == diff_above:  # Tie, first in file order wins
+                    closest = min(below, above, key=self._file_order.__getitem__)
+                else:
+                    closest = below if diff_below < diff_above else above
+            return self._direct_access[closest]
         else:
             raise KeyError(wavelength)
 
@@ -12,10 +12,20 @@ Functions:
 Authors: RLK, AVR, SDU
 """
 
+# ⚛️ Type checking
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
 # ✅ Standard library imports
 import atexit
 import logging
 import signal
+from pathlib import Path
+from time import sleep
 
 # ✅ Third-party imports
 import serial
@@ -28,6 +38,12 @@ from pychilaslasers.constants import Constants
 
 logger = logging.getLogger(__name__)
 
+# Set for constant time lookups on every command sent
+_SEMICOLON_COMMANDS = frozenset(Constants.SEMICOLON_COMMANDS)
+
+# Linux exposes the latency timer of USB-serial adapters (e.g. FTDI) here
+_USB_SERIAL_SYSFS = Path("/sys/bus/usb-serial/devices")
+
 
 class Communication:
     """Communication class for handling communication with the laser driver over serial.
@@ -37,28 +53,38 @@ class Communication:
     laser driver.
     """
 
-    def __init__(self, com_port: str) -> None:
+    def __init__(
+        self, com_port: str, baudrate: int = Constants.DEFAULT_BAUDRATE
+    ) -> None:
         """Initialize the Communication class with the specified serial port.
 
         This method sets up the serial connection to the laser driver and initializes
         the communication parameters. It also registers cleanup functions to ensure
         the serial connection is properly closed on exit or signal termination. And
-        sets the initial baudrate to the default value. When a connection fails, it will
-        attempt to reconnect using the next supported baudrate until a connection is
-        established as this is one of the most common issues when connecting to the
-        laser driver.
+        switches to the requested baudrate as soon as the connection is established.
+        When a connection fails, it will attempt to reconnect using the requested and
+        then the remaining supported baudrates until a connection is established as
+        this is one of the most common issues when connecting to the laser driver.
 
         Args:
             com_port: The serial port to connect to the laser driver.
                 this can be found by using the `pychilaslasers.comm.list_comports()`
                 function.
+            baudrate: The baudrate to use once the connection is established.
+                Defaults to the highest baudrate that is known to be reliable.
+
+        Raises:
+            ValueError: If the com_port is not a string or the baudrate is not
+                supported.
 
         """
-        # Validate the com_port input
+        # Validate the inputs
         if not isinstance(com_port, str):
             raise ValueError(
                 "The com_port must be a string representing the serial port."
             )
+        if baudrate not in Constants.SUPPORTED_BAUDRATES:
+            raise ValueError(f"The given baudrate {baudrate} is not supported.")
 
         # Initialize serial connection to the laser
         self._serial: serial.Serial = serial.Serial(
@@ -69,13 +95,31 @@ class Communication:
             stopbits=serial.STOPBITS_ONE,
             timeout=1.0,
         )
+        # The default driver buffers on Windows are small enough to overrun when
+        # the laser streams data at high baudrates. Only Windows supports resizing.
+        if hasattr(self._serial, "set_buffer_size"):
+            self._serial.set_buffer_size(
+                rx_size=Constants.SERIAL_RX_BUFFER_SIZE,
+                tx_size=Constants.SERIAL_TX_BUFFER_SIZE,
+            )
         self._previous_command: str = "None"
+        self._rx_buffer: bytearray = bytearray()
+
+        # Most USB-serial bridges buffer replies for several milliseconds before
+        # handing them to the OS, which dominates the round-trip time of short
+        # commands. Request low latency mode where the platform supports it.
+        self._low_latency: bool = False
+        self.low_latency = True
 
         self._prefix_mode: bool = True
-        # Attempt to open the serial connection by trying different baudrates
-        baudrates: set[int] = set(
-            Constants.SUPPORTED_BAUDRATES
-        )  # Copy to avoid modifying the original set
+        # Attempt to open the serial connection by trying different baudrates. A
+        # laser that was not shut down cleanly is most likely still running at the
+        # requested baudrate, so that one is tried first.
+        baudrates: list[int] = [
+            rate
+            for rate in dict.fromkeys((baudrate, *Constants.SUPPORTED_BAUDRATES))
+            if rate != Constants.TLM_INITIAL_BAUDRATE
+        ]
         rate = Constants.TLM_INITIAL_BAUDRATE
         while True:
             try:
@@ -83,12 +127,8 @@ class Communication:
                 break
             except Exception:
                 try:
-                    logger.error(
-                        f"Serial connection failed at {rate} baud.Attempting new "
-                        f"connection with baudrate {(rate := baudrates.pop())}."
-                    )
-                    self.baudrate = rate  # Try next baudrate if the current one fails
-                except KeyError:
+                    next_rate = baudrates.pop(0)
+                except IndexError:
                     logger.critical(
                         "No more supported baudrates available. Cannot establish serial"
                         " connection."
@@ -97,7 +137,15 @@ class Communication:
                         "Failed to establish serial connection with the laser driver. "
                         + "Please check the connection and supported baudrates."
                     ) from None
-        self.baudrate = Constants.DEFAULT_BAUDRATE
+                logger.error(
+                    "Serial connection failed at %d baud. Attempting new connection "
+                    "with baudrate %d.",
+                    rate,
+                    next_rate,
+                )
+                rate = next_rate
+                self.baudrate = rate  # Try next baudrate if the current one fails
+        self.baudrate = baudrate
 
         # Ensure proper closing of the serial connection on exit or signal
         try:
@@ -146,39 +194,79 @@ class Communication:
 
         """
         # Write the command to the serial port
-        logger.debug(msg=f"W {data}")  # Logs the command being sent
+        logger.debug("W %s", data)  # Logs the command being sent
         self._serial.write(f"{self._semicolon_replace(data)}\r\n".encode("ascii"))
-        self._serial.flush()
 
-        if not self.prefix_mode:
+        # Waiting for the reply already implies the command has been transmitted, so
+        # the output only needs to be flushed explicitly when there is no reply
+        if not self._prefix_mode:
+            self._serial.flush()
             return ""  # If prefix mode is off, return empty string immediately
 
-        # Read the response from the laser
-        try:
-            reply: str = self._serial.readline().decode("ascii").rstrip()
-        except UnicodeDecodeError as e:
-            logger.error(f"Failed to decode reply from device: {e}")
-            raise serial.SerialException(
-                f"Failed to decode reply from device: {e}. "
-                + "Please check the connection and baudrate settings."
-            ) from e
+        return self._read_reply()
 
-        # Error handling
-        if not reply or reply == "":
-            logger.error("Empty reply from device")
-            raise serial.SerialException(
-                "Empty reply from device. Please check the connection and prefix mode."
-            )
+    def query_batch(self, commands: Sequence[str]) -> list[str]:
+        """Send multiple commands to the laser at once and return their responses.
 
-        if reply[0] != "0":
-            logger.error(f"Nonzero return code: {reply[2:]}")
-            raise LaserError(
-                code=reply[2:6], message=reply[8:]
-            )  # Raise a custom error with the reply message
-        else:
-            logger.debug(f"R {reply}")
+        The commands are written to the serial connection without waiting for the
+        responses, which are read in the order the commands were given. Compared to
+        calling `query` for every command, this saves the round-trip time of all but
+        one of the commands. Batches of up to `Constants.BATCH_PIPELINE_DEPTH`
+        commands are sent in a single transmission, larger batches are streamed
+        with that many commands in flight. This is only suitable for commands that
+        do not depend on the response of a previous command in the same batch.
 
-        return reply[2:]
+        Args:
+            commands: The serial commands to be sent to the laser.
+
+        Returns:
+            list[str]:
+            The responses from the laser, one for every command, processed the same
+                way as in `query`.
+
+        Raises:
+            serial.SerialException: If there is an error in the serial communication,
+                such as a decoding error or an empty reply.
+            LaserError: If the response code of any of the commands is not 0. All
+                responses are read before the first error is raised, so the
+                connection stays in sync.
+
+        """
+        if not commands:
+            return []
+
+        lines: list[bytes] = []
+        for data in commands:
+            logger.debug("W %s", data)
+            lines.append(f"{self._semicolon_replace(data)}\r\n".encode("ascii"))
+
+        if not self._prefix_mode:
+            self._serial.write(b"".join(lines))
+            self._serial.flush()
+            return ["" for _ in commands]
+
+        # Only a limited number of commands is kept in flight so large batches can
+        # not overflow the input buffer of the driver. Once half of them have been
+        # answered, the window is topped up again in a single write.
+        depth: int = Constants.BATCH_PIPELINE_DEPTH
+        sent: int = min(depth, len(lines))
+        self._serial.write(b"".join(lines[:sent]))
+
+        replies: list[str] = []
+        error: LaserError | None = None
+        for received in range(1, len(lines) + 1):
+            try:
+                replies.append(self._read_reply())
+            except LaserError as e:
+                error = error or e
+                replies.append("")
+            if sent < len(lines) and sent - received <= depth // 2:
+                end: int = received + depth
+                self._serial.write(b"".join(lines[sent:end]))
+                sent = min(end, len(lines))
+        if error is not None:
+            raise error
+        return replies
 
     def close_connection(self, signum=None, fname=None) -> None:
         """Close the serial connection to the laser driver safely.
@@ -191,8 +279,9 @@ class Communication:
         if self._serial and self._serial.is_open:
             if signum is not None:
                 logger.error(
-                    f"Received signal {signal.Signals(signum).name} ({signum}):"
-                    "closing connection"
+                    "Received signal %s (%d): closing connection",
+                    signal.Signals(signum).name,
+                    signum,
                 )
             else:
                 logger.debug("Closing connection")
@@ -207,6 +296,69 @@ class Communication:
 
     ########## Private Methods ##########
 
+    def _read_reply(self) -> str:
+        """Read a single response from the laser and check its return code.
+
+        Returns:
+            The response stripped of any leading or trailing whitespace as well as the
+                return code.
+
+        Raises:
+            serial.SerialException: If the reply could not be decoded or is empty.
+            LaserError: If the response code from the laser is not 0.
+
+        """
+        try:
+            reply: str = self._readline().decode("ascii").rstrip()
+        except UnicodeDecodeError as e:
+            logger.error("Failed to decode reply from device: %s", e)
+            raise serial.SerialException(
+                f"Failed to decode reply from device: {e}. "
+                + "Please check the connection and baudrate settings."
+            ) from e
+
+        # Error handling
+        if not reply or reply == "":
+            logger.error("Empty reply from device")
+            raise serial.SerialException(
+                "Empty reply from device. Please check the connection and prefix mode."
+            )
+
+        if reply[0] != "0":
+            logger.error("Nonzero return code: %s", reply[2:])
+            raise LaserError(
+                code=reply[2:6], message=reply[8:]
+            )  # Raise a custom error with the reply message
+        else:
+            logger.debug("R %s", reply)
+
+        return reply[2:]
+
+    def _readline(self) -> bytes:
+        """Read a single line from the serial connection.
+
+        `serial.Serial.readline` requests a single byte from the operating system at a
+        time. Instead, all bytes waiting in the receive buffer are read at once and
+        anything past the end of the line is kept for the next call, as the replies
+        to a `query_batch` may arrive together.
+
+        Returns:
+            The line including its terminator, or whatever was received before the
+                timeout expired.
+
+        """
+        buffer: bytearray = self._rx_buffer
+        while (end := buffer.find(b"\n")) < 0:
+            chunk: bytes = self._serial.read(self._serial.in_waiting or 1)
+            if not chunk:  # Timeout, return what was received so far
+                line = bytes(buffer)
+                buffer.clear()
+                return line
+            buffer += chunk
+        line = bytes(buffer[: end + 1])
+        del buffer[: end + 1]
+        return line
+
     def _semicolon_replace(self, cmd: str) -> str:
         """To speed up communication, repeating commands can be replaced by a semicolon.
 
@@ -220,15 +372,30 @@ class Communication:
             The command with semicolon inserted
 
         """
-        if (
-            cmd.split(" ")[0] == self._previous_command
-            and self._previous_command in Constants.SEMICOLON_COMMANDS
-        ):
-            cmd = cmd.replace(cmd.split(" ")[0], ";")
-        else:
-            self._previous_command = cmd.split(" ")[0]
+        name, sep, args = cmd.partition(" ")
+        if name == self._previous_command and name in _SEMICOLON_COMMANDS:
+            return f";{sep}{args}"
+        self._previous_command = name
         return cmd
 
+    def _set_latency_timer(self, milliseconds: int) -> bool:
+        """Set the latency timer of a USB-serial adapter through sysfs.
+
+        Args:
+            milliseconds: The latency timer value to set.
+
+        Returns:
+            Whether the latency timer was set successfully.
+
+        """
+        device: str = Path(str(self.port)).resolve().name
+        try:
+            (_USB_SERIAL_SYSFS / device / "latency_timer").write_text(f"{milliseconds}")
+        except OSError:
+            return False
+        logger.debug("Set latency timer of %s to %d ms", device, milliseconds)
+        return True
+
     def _initialize_variables(self) -> None:
         """Initialize private variables."""
         self._previous_command = "None"
@@ -282,13 +449,13 @@ class Communication:
         """
         self._prefix_mode = mode  # mode needs to be set first before next query
         self.query(f"SYST:COMM:PFX {mode:d}")
-        logger.info(f"Changed prefix mode to {mode}")
+        logger.info("Changed prefix mode to %s", mode)
 
     @property
     def baudrate(self) -> int:
         """Gets the baudrate of the serial connection to the driver.
 
-        The baudrate can be changed, but does require a serial reconnect
+        The baudrate can be changed while the connection is open.
 
         ??? info "Currently supported baudrates are:"
             - 9600
@@ -318,7 +485,7 @@ class Communication:
     def baudrate(self, new_baudrate: int) -> None:
         """Set the baudrate of the serial connection to the driver.
 
-        The baudrate can be changed, but this requires a serial reconnect.
+        The baudrate is changed on the open serial connection, without a reconnect.
 
         Currently supported baudrates are:
             - 9600
@@ -340,9 +507,12 @@ class Communication:
         If the new requested baudrate is different then it will set the new baudrate
         as follows:
             1. Instruct the driver to use a new baudrate
-            2. Close the serial connection
-            3. Change the serial connection attribute to use the new baudrate as well
-            4. Reopen the serial connection
+            2. Wait until the instruction has been transmitted at the old baudrate
+            3. Reconfigure the open serial connection to use the new baudrate
+            4. Wait for the driver to switch, then discard anything received
+
+        Closing and reopening a USB-serial port can take hundreds of milliseconds
+        and resets port settings such as low latency mode, so this is avoided.
 
         Args:
             new_baudrate (int): new baudrate to use
@@ -358,20 +528,73 @@ class Communication:
 
         # 1. Instruct driver to use new baudrate
         logger.info(
-            f"Switching baudrates from {self._serial.baudrate} to {new_baudrate}."
+            "Switching baudrates from %d to %d.", self._serial.baudrate, new_baudrate
         )
         self._serial.write(f"SYST:SER:BAUD {new_baudrate:d}\r\n".encode("ascii"))
         logger.debug(
-            f"[baudrate_switch] Writing to serial: SYST:SER:BAUD {new_baudrate:d}"
+            "[baudrate_switch] Writing to serial: SYST:SER:BAUD %d", new_baudrate
         )
-        # 2. Close serial connection
-        logger.debug("[baudrate_switch] Closing serial connection")
-        self._serial.close()
-        # 3. Change serial connection baudrate attribute
+        # 2. Make sure the instruction is sent before switching
+        self._serial.flush()
+        self._rx_buffer.clear()
+        # 3. Reconfigure the open serial connection
+        logger.debug("[baudrate_switch] Reconfiguring serial connection baudrate")
         self._serial.baudrate = new_baudrate
-        # 4. Reopen serial connection
-        logger.debug("[baudrate_switch] Reopening serial connection with new baudrate")
-        self._serial.open()
+        # Anything received at the old baudrate, or line noise while the driver
+        # switches, would otherwise be read as the reply to the next command. Wait
+        # for it to arrive before discarding it. Reopening the port used to discard
+        # it implicitly.
+        sleep(Constants.BAUDRATE_SWITCH_SETTLE_MS / 1000)
+        self._serial.reset_input_buffer()
+        # Not every platform keeps the low latency flag when reconfiguring the port
+        if self._low_latency:
+            self.low_latency = True
+
+    @property
+    def low_latency(self) -> bool:
+        """Gets whether low latency mode is enabled on the serial port.
+
+        Many USB-serial bridges (e.g. FTDI) wait up to 16 ms before passing received
+        data on to the operating system. As every command to the laser is answered
+        with a short reply, this delay dominates the time each query takes. Low
+        latency mode lowers this delay to the minimum the driver allows.
+
+        Low latency mode is enabled by default when the connection is opened. It is
+        only supported on Linux; on other platforms this property stays False. If the
+        serial driver does not support low latency mode directly, the latency timer
+        of the USB-serial adapter is lowered through sysfs instead, which requires
+        write access to it.
+
+        Returns:
+            whether low latency mode is enabled (True) or not (False)
+
+        """
+        return self._low_latency
+
+    @low_latency.setter
+    def low_latency(self, enabled: bool) -> None:
+        """Enable or disable low latency mode on the serial port.
+
+        Failing to change the mode is not considered an error, as it only affects
+        the speed of the communication. In that case the property remains False.
+
+        Args:
+            enabled: whether to enable low latency mode (True) or disable it (False)
+
+        """
+        try:
+            self._serial.set_low_latency_mode(enabled)
+        except (AttributeError, NotImplementedError, ValueError, OSError) as e:
+            if not self._set_latency_timer(
+                Constants.LOW_LATENCY_TIMER_MS
+                if enabled
+                else Constants.DEFAULT_LATENCY_TIMER_MS
+            ):
+                logger.debug("Low latency mode not available on %s: %s", self.port, e)
+                self._low_latency = False
+                return
+        self._low_latency = enabled
+        logger.debug("Changed low latency mode to %s", enabled)
 
     @property
     def port(self) -> str:
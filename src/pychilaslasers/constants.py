@@ -24,6 +24,22 @@ class Constants:
         912600,
     )
 
+    # Serial driver buffer sizes in bytes (only applied on Windows)
+    SERIAL_RX_BUFFER_SIZE = 256 * 1024
+    SERIAL_TX_BUFFER_SIZE = 64 * 1024
+
+    # Latency timer of USB-serial adapters in milliseconds, used when low latency
+    # mode can not be set on the serial port directly
+    LOW_LATENCY_TIMER_MS = 1
+    DEFAULT_LATENCY_TIMER_MS = 16
+
+    # Time in milliseconds given to the driver to switch baudrate, before input
+    # received during the switch is discarded
+    BAUDRATE_SWITCH_SETTLE_MS = 50
+
+    # Maximum number of commands sent ahead of their replies in a batch
+    BATCH_PIPELINE_DEPTH = 32
+
     # ERROR CODES THAT SHOULD TRIGGER A ERROR DIALOG (errors 14 to 23)
     CRITICAL_ERRORS: tuple[str, ...] = tuple(
         ["E0" + str(x) for x in range(14, 24)] + ["E0" + str(x) for x in range(30, 51)]
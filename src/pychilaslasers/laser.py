@@ -22,13 +22,20 @@ laser may not achieve the desired wavelength.
 # ⚛️ Type checking
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
 # ✅ Standard library imports
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
 # ✅ Local imports
 from pychilaslasers.system import System
 from pychilaslasers.modes.sweep_mode import SweepMode
 from pychilaslasers.comm import Communication
+from pychilaslasers.constants import Constants
 from pychilaslasers.exceptions.mode_error import ModeError
 from pychilaslasers.laser_components.diode import Diode
 from pychilaslasers.laser_components.tec import TEC
@@ -36,7 +43,7 @@ from pychilaslasers.modes.manual_mode import ManualMode
 from pychilaslasers.modes.mode import LaserMode, Mode
 from pychilaslasers.modes.tune_mode import TuneMode
 from pychilaslasers.calibration import Calibration
-from pychilaslasers.calibration.calibration_parsing import load_calibration
+from pychilaslasers.calibration.calibration_parsing import _load_shared_calibration
 from pychilaslasers.laser_components.sensors import EnclosureTemp, PhotoDiode, CPU
 from pathlib import Path
 
@@ -86,12 +93,16 @@ class Laser:
     """
 
     def __init__(
-        self, com_port: str, calibration_file: str | Path | None = None
+        self,
+        com_port: str,
+        calibration_file: str | Path | None = None,
+        baudrate: int = Constants.DEFAULT_BAUDRATE,
     ) -> None:
         """Initialize the laser with the given COM port and calibration file.
 
         Opens the serial connection to the laser, initializes the laser components and
-        variables, and sets the initial mode to manual.
+        variables, and sets the initial mode to manual. The calibration file is parsed
+        in the background while the connection is being set up.
 
         Warning:
             During the initialization, **the laser will turn on** and communicate over
@@ -104,9 +115,21 @@ class Laser:
                 `pychilaslasers.comm.list_comports` method from the `comm` module.
             calibration_file (str | Path):
                 The path to the calibration file that was provided for the laser.
+            baudrate: The baudrate used to communicate with the laser. The
+                connection switches to this baudrate right after it is opened.
 
         """
-        self._comm: Communication = Communication(com_port=com_port)
+        # Parsing the calibration file does not depend on the laser, so it is done
+        # while waiting on the serial communication below
+        calibration_future: Future[Calibration] | None = None
+        if calibration_file is not None:
+            executor = ThreadPoolExecutor(max_workers=1)
+            calibration_future = executor.submit(
+                _load_shared_calibration, calibration_file
+            )
+            executor.shutdown(wait=False)  # Worker exits once parsing is done
+
+        self._comm: Communication = Communication(com_port=com_port, baudrate=baudrate)
         self._system = System(self)
 
         try:
@@ -136,14 +159,16 @@ class Laser:
             self._tune_mode: TuneMode | None = None
             self._sweep_mode: SweepMode | None = None
 
-            if calibration_file is not None:
-                self.calibrate(calibration_file=calibration_file)
+            if calibration_future is not None:
+                self.calibrate(calibration_object=calibration_future.result())
 
             self._mode: Mode = self._manual_mode
 
             logger.debug(
-                f"Initialized laser {self._model} on {com_port} with calibration file "
-                f"{calibration_file}"
+                "Initialized laser %s on %s with calibration file %s",
+                self._model,
+                com_port,
+                calibration_file,
             )
         except Exception as e:
             self._comm.close_connection()
@@ -188,7 +213,7 @@ class Laser:
         calibration: Calibration
         if calibration_object is None:
             assert calibration_file is not None  # Type guard
-            calibration = load_calibration(file_path=calibration_file)
+            calibration = _load_shared_calibration(file_path=calibration_file)
         else:
             calibration = calibration_object
 
@@ -196,10 +221,11 @@ class Laser:
         if (
             no := calibration.serial_number
         ) is not None and no != self.system.serial_no:
-            logging.getLogger(__name__).critical(
-                "Calibration file is for a different laser."
-                + f"Calibration file serial number = {no} "
-                + f"Laser serial number = {self.system.serial_no}"
+            logger.critical(
+                "Calibration file is for a different laser. "
+                "Calibration file serial number = %s Laser serial number = %s",
+                no,
+                self.system.serial_no,
             )
         self._calibration = calibration
         self._model = calibration.model
@@ -253,6 +279,9 @@ class Laser:
             logger.error("ERROR: given state is not a boolean")
             return
         self._comm.query(f"SYST:STAT {state:d}")
+        # The heaters do not keep their values when the laser is turned off and on
+        if self._tune_mode is not None:
+            self._tune_mode.reset_tuning_state()
 
     @property
     def mode(self) -> LaserMode:
@@ -364,7 +393,7 @@ class Laser:
             self._sweep_mode.stop()
 
         self._mode.apply_defaults()
-        logging.info(f"Laser mode set to {self._mode.mode}")
+        logger.info("Laser mode set to %s", self._mode.mode)
 
     @property
     def tune(self) -> TuneMode:
@@ -49,9 +49,19 @@ class Heater(Driver):
 
         """
         super().__init__(laser)
-        self._min: float = float(self._comm.query(f"DRV:LIM:MIN? {self.channel.value}"))
-        self._max: float = float(self._comm.query(f"DRV:LIM:MAX? {self.channel.value}"))
-        self._unit: str = self._comm.query(f"DRV:UNIT? {self.channel.value}").strip()
+        # The channel never changes, so its number is resolved once for all queries
+        self._channel_no: int = self.channel.value
+        # The limits and unit are fetched in a single round-trip
+        min_value, max_value, unit = self._comm.query_batch(
+            [
+                f"DRV:LIM:MIN? {self._channel_no}",
+                f"DRV:LIM:MAX? {self._channel_no}",
+                f"DRV:UNIT? {self._channel_no}",
+            ]
+        )
+        self._min: float = float(min_value)
+        self._max: float = float(max_value)
+        self._unit: str = unit.strip()
 
     ########## Properties (Getters/Setters) ##########
 
@@ -77,7 +87,7 @@ class Heater(Driver):
             The current heater drive value.
 
         """
-        return float(self._comm.query(f"DRV:D? {self.channel.value:d}"))
+        return float(self._comm.query(f"DRV:D? {self._channel_no:d}"))
 
     @value.setter
     def value(self, value: float) -> None:
@@ -99,7 +109,7 @@ class Heater(Driver):
                 f"{self._min} and {self._max} {self._unit}."
             )
 
-        self._comm.query(f"DRV:D {self.channel.value:d} {value:.3f}")
+        self._comm.query(f"DRV:D {self._channel_no:d} {value:.3f}")
 
     @property
     def temp(self) -> float:
@@ -109,8 +119,9 @@ class Heater(Driver):
             This temperature is the same regardless of instance the method is called on.
             There is only one sensor for all drivers.
         """
-        self._comm.query("SYST:TEMP:NSEL 0")
-        return float(self._comm.query("SYST:TEMP:TEMP?"))
+        # Select the sensor and read it in a single round-trip
+        _, temp = self._comm.query_batch(["SYST:TEMP:NSEL 0", "SYST:TEMP:TEMP?"])
+        return float(temp)
 
     ########## Method Overloads/Aliases ##########
 
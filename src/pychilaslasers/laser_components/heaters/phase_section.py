@@ -60,7 +60,7 @@ class PhaseSection(Heater):
         if not isinstance(value, bool):
             raise ValueError("anti_hyst must be a boolean.")
         logging.getLogger(__name__).info(
-            f"Phase Anti-Hysteresis procedure {'Enabled' if value else 'Disabled'}"
+            "Phase Anti-Hysteresis procedure %s", "Enabled" if value else "Disabled"
         )
         self._anti_hyst_enabled = value
 
@@ -118,7 +118,7 @@ class PhaseSection(Heater):
         if self._anti_hyst_enabled:
             self._anti_hyst(value)
         else:
-            self._comm.query(f"DRV:D {self.channel.value:d} {value:.3f}")
+            self._comm.query(f"DRV:D {self._channel_no:d} {value:.3f}")
 
     @staticmethod
     def get_antihyst_method(
@@ -143,6 +143,8 @@ class PhaseSection(Heater):
               an optional phase voltage.
         """
         query: Callable[[str], str] = laser.comm.query
+        # Resolved once instead of on every step of the ramp
+        channel: int = HeaterChannel.PHASE_SECTION.value
 
         phase_min: float
         phase_max: float
@@ -152,11 +154,14 @@ class PhaseSection(Heater):
             phase_min = laser._manual_mode.phase_section.min_value
         except AttributeError as e:
             if laser.system_state:
-                phase_max = float(
-                    laser.comm.query(f"DRV:LIM:MAX? {PhaseSection.channel}")
-                )
-                phase_min = float(
-                    laser.comm.query(f"DRV:LIM:MIN? {PhaseSection.channel}")
+                phase_max, phase_min = map(
+                    float,
+                    laser.comm.query_batch(
+                        [
+                            f"DRV:LIM:MAX? {channel}",
+                            f"DRV:LIM:MIN? {channel}",
+                        ]
+                    ),
                 )
             else:
                 raise ModeError(
@@ -166,13 +171,15 @@ class PhaseSection(Heater):
         voltage_steps = (
             Defaults.TUNE_ANTI_HYST[0] if voltage_steps is None else voltage_steps
         )
-        time_steps = Defaults.TUNE_ANTI_HYST[0] if time_steps is None else time_steps
+        time_steps = Defaults.TUNE_ANTI_HYST[1] if time_steps is None else time_steps
 
         time_steps = (
             [time_steps[0]] * (len(voltage_steps) - 1) + [0]
             if len(time_steps) == 1
             else [*time_steps, 0]
         )
+        # Converted to seconds once, rather than on every step of every run
+        sleep_times: list[float] = [t / 1000 for t in time_steps]
 
         def antihyst(v_phase: float | None = None) -> None:
             """Apply anti-hysteresis correction to the laser.
@@ -183,27 +190,39 @@ class PhaseSection(Heater):
             data.
             """
             if v_phase is None:
-                v_phase = float(query(f"DRV:D? {HeaterChannel.PHASE_SECTION.value:d}"))
-
-            for i, voltage_step in enumerate(voltage_steps):
-                if v_phase**2 + voltage_step < 0:
+                v_phase = float(query(f"DRV:D? {channel:d}"))
+
+            # The whole ramp is computed up front, so only the writes and waits are
+            # left between the steps
+            v_phase_squared: float = v_phase * v_phase
+            ramp: list[float] = []
+            for voltage_step in voltage_steps:
+                if (v_squared := v_phase_squared + voltage_step) < 0:
                     value: float = 0
                     logging.getLogger(__name__).warning(
-                        "Anti-hysteresis "
-                        f"value out of bounds: {value} (min: {phase_min}, max: "
-                        f"{phase_max}). Approximating by 0"
+                        "Anti-hysteresis value out of bounds: %s (min: %s, max: %s). "
+                        "Approximating by 0",
+                        value,
+                        phase_min,
+                        phase_max,
                     )
                 else:
-                    value = sqrt(v_phase**2 + voltage_step)
+                    value = sqrt(v_squared)
                 if value < phase_min or value > phase_max:
                     logging.getLogger(__name__).error(
-                        "Anti-hysteresis"
-                        f"value out of bounds: {value} (min: {phase_min}, max: "
-                        f"{phase_max}). Approximating with the closest limit."
+                        "Anti-hysteresis value out of bounds: %s (min: %s, max: %s). "
+                        "Approximating with the closest limit.",
+                        value,
+                        phase_min,
+                        phase_max,
                     )
                     value = min(value, phase_max)
                     value = max(value, phase_min)
-                query(f"DRV:D {HeaterChannel.PHASE_SECTION.value:d} {value:.4f}")
-                sleep(time_steps[i] / 1000)
+                ramp.append(value)
+
+            for i, value in enumerate(ramp):
+                query(f"DRV:D {channel:d} {value:.4f}")
+                if sleep_times[i]:  # The last step has no wait
+                    sleep(sleep_times[i])
 
         return antihyst
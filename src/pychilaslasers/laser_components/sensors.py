@@ -35,8 +35,9 @@ class EnclosureTemp(LaserComponent):
     @property
     def temp(self):
         """Returns the current temperature readout of the sensor on the enclosure."""
-        self._comm.query("SYST:TEMP:NSEL 1")
-        return float(self._comm.query("SYST:TEMP:TEMP?"))
+        # Select the sensor and read it in a single round-trip
+        _, temp = self._comm.query_batch(["SYST:TEMP:NSEL 1", "SYST:TEMP:TEMP?"])
+        return float(temp)
 
 
 class CPU(LaserComponent):
@@ -55,8 +56,9 @@ class CPU(LaserComponent):
     @property
     def temp(self):
         """Returns the current temperature readout of the sensor in the CPU."""
-        self._comm.query("SYST:TEMP:NSEL 1")
-        return float(self._comm.query("SYST:TEMP:TEMP?"))
+        # Select the sensor and read it in a single round-trip
+        _, temp = self._comm.query_batch(["SYST:TEMP:NSEL 1", "SYST:TEMP:TEMP?"])
+        return float(temp)
 
 
 class PhotoDiodeChannel(Enum):
@@ -82,6 +84,7 @@ class PhotoDiode(LaserComponent):
             if isinstance(channel, PhotoDiodeChannel)
             else PhotoDiodeChannel(channel)
         )
+        self._channel_no: int = self._channel.value
 
     @property
     @override
@@ -91,12 +94,12 @@ class PhotoDiode(LaserComponent):
     @property
     def readout(self) -> float:
         """Returns the photodiode readout as a float."""
-        return float(self._comm.query(f"MEAS:M? {self.channel.value}"))
+        return float(self._comm.query(f"MEAS:M? {self._channel_no}"))
 
     @cached_property
     @override
     def unit(self) -> str:
-        return self._comm.query(f"MEAS:UNIT? {self.channel}")
+        return self._comm.query(f"MEAS:UNIT? {self._channel_no}")
 
     @property
     def channel(self) -> PhotoDiodeChannel:
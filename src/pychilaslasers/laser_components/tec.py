@@ -48,8 +48,9 @@ class TEC(Driver):
 
         """
         super().__init__(laser=laser)
-        self._min: float = float(self._comm.query("TEC:CFG:TMIN?"))
-        self._max: float = float(self._comm.query("TEC:CFG:TMAX?"))
+        min_temp, max_temp = self._comm.query_batch(["TEC:CFG:TMIN?", "TEC:CFG:TMAX?"])
+        self._min: float = float(min_temp)
+        self._max: float = float(max_temp)
         self._unit: str = "°C"
 
     ########## Properties (Getters/Setters) ##########
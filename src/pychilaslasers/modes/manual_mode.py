@@ -17,11 +17,11 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from pychilaslasers.laser import Laser
-    from pychilaslasers.laser_components.heaters.heater_channels import HeaterChannel
     from pychilaslasers.laser_components.heaters.heaters import Heater
 
 # ✅ Local imports
 from pychilaslasers.laser_components.heaters import (
+    HeaterChannel,
     LargeRing,
     PhaseSection,
     SmallRing,
@@ -105,6 +105,8 @@ class ManualMode(Mode):
             Setting inappropriate voltages may result in errors or undefined behavior.
 
         """
+        if isinstance(heater_ch, HeaterChannel):
+            heater_ch = heater_ch.value
         self._comm.query(f"DRV:D {heater_ch:d} {heater_value:.4f}")
 
     ########## Properties (Getters/Setters) ##########
@@ -19,6 +19,7 @@ if TYPE_CHECKING:
 
 # ✅ Standard library imports
 import logging
+from time import monotonic, sleep
 
 # ✅ Local imports
 from pychilaslasers.exceptions.laser_error import LaserError
@@ -103,7 +104,7 @@ class SweepMode(__Calibrated):
             self.set_range(start_wl=self._max_wl, end_wl=self._min_wl)
         except LaserError as e:
             if "cycler" not in e.message:
-                logging.getLogger(__name__).error(f"Failed to set sweep range: {e}")
+                logging.getLogger(__name__).error("Failed to set sweep range: %s", e)
                 raise e
 
         self.interval = self._default_interval
@@ -138,6 +139,35 @@ class SweepMode(__Calibrated):
         """
         self._comm.query(data="DRV:CYC:CONT")
 
+    def wait_until_done(
+        self, timeout: float | None = None, poll_interval: float = 0.01
+    ) -> bool:
+        """Block until the current sweep operation has finished.
+
+        Polls the laser for the state of the cycler rather than sleeping for the
+        estimated duration of the sweep, so it returns as soon as the laser is done.
+
+        Warning:
+            When the number of sweeps is 0 (infinite sweeps) the sweep never finishes
+            on its own. Provide a timeout and stop the sweep once it expires. The
+            connection to the laser is not thread-safe, so do not stop the sweep
+            from another thread while this method is polling.
+
+        Args:
+            timeout: Maximum time to wait in seconds. Waits indefinitely if None.
+            poll_interval: Time between consecutive polls in seconds.
+
+        Returns:
+            True if the sweep has finished, False if the timeout expired first.
+
+        """
+        deadline: float | None = None if timeout is None else monotonic() + timeout
+        while self.cycler_running:
+            if deadline is not None and monotonic() >= deadline:
+                return False
+            sleep(poll_interval)
+        return True
+
     def get_total_time(self) -> float:
         """Calculate the total estimated time for the complete sweep operation.
 
@@ -161,12 +191,9 @@ class SweepMode(__Calibrated):
                 including both the lower and upper wavelengths.
 
         """
-        start, end = self.range
-        return [
-            wl
-            for wl in [e.wavelength for e in self._calibration]
-            if wl <= start and wl >= end
-        ]
+        # The cycler steps through the table entries between the span indices
+        index_start, index_end = map(int, self._comm.query("DRV:CYC:SPAN?").split())
+        return self._calibration.wavelengths[index_start : index_end + 1]
 
     ########## Properties (Getters/Setters) ##########
 
@@ -268,11 +295,9 @@ class SweepMode(__Calibrated):
                 value, reflecting the high-to-low sweep direction.
 
         """
-        [index_start, index_end] = self._comm.query("DRV:CYC:SPAN?").split(" ")
-        return (
-            self._calibration.entries[int(index_start)].wavelength,
-            self._calibration.entries[int(index_end)].wavelength,
-        )
+        index_start, index_end = map(int, self._comm.query("DRV:CYC:SPAN?").split())
+        wavelengths: list[float] = self._calibration.wavelengths
+        return wavelengths[index_start], wavelengths[index_end]
 
     @range.setter
     def range(self, range: tuple[float, float] | list[float]) -> None:
@@ -301,9 +326,11 @@ class SweepMode(__Calibrated):
 
         """
         start_wl, end_wl = range
-        if end_wl < self._min_wl or start_wl > self._max_wl:
-            raise ValueError(f"Range must be in [{self._max_wl} -> {self._min_wl}].")
-        if start_wl <= end_wl:
+        min_wl, max_wl = self._min_wl, self._max_wl
+        # A valid range passes a single chained comparison
+        if not min_wl <= end_wl < start_wl <= max_wl:
+            if end_wl < min_wl or start_wl > max_wl:
+                raise ValueError(f"Range must be in [{max_wl} -> {min_wl}].")
             raise ValueError(
                 f"Start wavelength {start_wl} cannot be less than end wavelength "
                 f"{end_wl}."
@@ -393,6 +420,9 @@ class SweepMode(__Calibrated):
                 if it is greater than or equal to the current end wavelength.
 
         """
+        # Reject out of range values before querying the current range
+        if not self._min_wl <= wavelength <= self._max_wl:
+            raise ValueError(f"Range must be in [{self._max_wl} -> {self._min_wl}].")
         self.range = (wavelength, self.end_wavelength)
 
     @property
@@ -422,6 +452,9 @@ class SweepMode(__Calibrated):
                 if it is less than or equal to the current start wavelength.
 
         """
+        # Reject out of range values before querying the current range
+        if not self._min_wl <= wavelength <= self._max_wl:
+            raise ValueError(f"Range must be in [{self._max_wl} -> {self._min_wl}].")
         self.range = (self.start_wavelength, wavelength)
 
     def get_range(self) -> tuple[float, float]:
@@ -63,10 +63,15 @@ class TuneMode(__Calibrated):
         self.anti_hyst_enabled: bool = True  # Default to enabled
 
         self._wl: float = self._min_wl  # Default to minimum wavelength
+        # Mode the laser was last tuned to with anti-hysteresis correction enabled
+        # (COMET only), None if unknown
+        self._mode_index: int | None = None
+        # Calibration entry the laser was last tuned to, None if unknown
+        self._entry: CalibrationEntry | None = None
 
         self._antihyst = laser._manual_mode.phase_section._anti_hyst
 
-        self._change_method: Callable[[float], float]
+        self._change_method: Callable[[CalibrationEntry], float]
 
         # Initialize wavelength change method
         if (method := calibration.tune_settings.method) is TuneMethod.FILE:
@@ -87,6 +92,23 @@ class TuneMode(__Calibrated):
         """
         self._laser.tec.target = self._default_TEC
         self._laser.diode.current = self._default_current
+        # The heaters may have been changed outside of tune mode
+        self.reset_tuning_state()
+
+    def reset_tuning_state(self) -> None:
+        """Forget the state of the last tuning.
+
+        Must be called whenever the heaters may have been changed outside of tune
+        mode, e.g. by switching modes or turning the laser off and on, so that the
+        next tuning applies all heater values and anti-hysteresis correction again
+        instead of relying on stale state.
+
+        Note:
+            Heater values written directly through the laser connection can not be
+            detected, call this method after doing so.
+        """
+        self._mode_index = None
+        self._entry = None
 
     ########## Properties (Getters/Setters) ##########
 
@@ -122,11 +144,16 @@ class TuneMode(__Calibrated):
                 f"{self._min_wl} and {self._max_wl}."
             )
 
-        self._wl = self._change_method(wavelength)
+        entry: CalibrationEntry = self._calibration[wavelength]
+        if entry is self._entry:
+            # Already tuned to this entry, only the trigger pulse is left to send
+            if self._autoTrig:
+                self._laser.trigger_pulse()
+            return self._wl
 
-        # Trigger pulse if auto-trigger is enabled (inherited from parent)
-        if self._autoTrig:
-            self._laser.trigger_pulse()
+        # Also sends the trigger pulse if auto-trigger is enabled
+        self._wl = self._change_method(entry)
+        self._entry = entry
 
         return self._wl
 
@@ -149,6 +176,8 @@ class TuneMode(__Calibrated):
 
         """
         self.anti_hyst_enabled = state
+        # Tunings made with the other state can not be relied on to skip correction
+        self.reset_tuning_state()
 
     @property
     def mode(self) -> LaserMode:
@@ -187,15 +216,17 @@ class TuneMode(__Calibrated):
             ValueError: If the resulting wavelength is outside the valid range.
 
         """
-        old = self.wavelength
-        self.wavelength = self.get_wl() + delta
+        target: float = self._wl + delta
+
+        if (
+            target in self._calibration
+            and self._calibration[target].wavelength == self._wl
+        ):
+            # The step is smaller than the calibration spacing, so move to the
+            # neighbouring wavelength instead of tuning to the current one again
+            target = self._calibration.neighbour(self._wl, delta)
 
-        if self.wavelength == old:
-            delta = -1 if delta <= 0 else 1
-            self.wavelength = self._calibration.entries[
-                self._calibration.entries.index(self._calibration[self.wavelength])
-                + delta
-            ].wavelength
+        self.wavelength = target
 
         return self.wavelength
 
@@ -209,13 +240,13 @@ class TuneMode(__Calibrated):
         """
         if state is None:
             # Toggle the current state
-            self.anti_hyst_enabled = not self.anti_hyst_enabled
+            self.antihyst = not self.anti_hyst_enabled
         else:
-            self.anti_hyst_enabled = state
+            self.antihyst = state
 
     ########## Private Classes ##########
 
-    def _pre_load_from_file(self, wavelength: float) -> float:
+    def _pre_load_from_file(self, entry: CalibrationEntry) -> float:
         """Set wavelength by preloading the values from the file then updating.
 
         Loads heater values from calibration table and applies them to the laser.
@@ -228,41 +259,33 @@ class TuneMode(__Calibrated):
             application.
 
         Args:
-            wavelength: Target wavelength in nanometers.
+            entry: Calibration entry of the target wavelength.
 
         Returns:
             The actual wavelength that was set.
         """
-        try:
-            entry: CalibrationEntry = self._calibration[wavelength]
-        except KeyError as e:
-            raise ValueError(
-                f"Wavelength {wavelength} not found in calibration table."
-            ) from e
-
-        # Preload the laser with the calibration entry values
-        self._comm.query(f"DRV:DP 0 {entry.phase_section:.4f}")
-        self._comm.query(f"DRV:DP 1 {entry.large_ring:.4f}")
-        self._comm.query(f"DRV:DP 2 {entry.small_ring:.4f}")
-        self._comm.query(f"DRV:DP 3 {entry.coupler:.4f}")
+        # Preload the laser with the calibration entry values. They are pipelined,
+        # but all replies are checked before the values are applied, so a rejected
+        # value never leaves the heaters partially updated.
+        self._comm.query_batch(
+            [
+                f"DRV:DP 0 {entry.phase_section:.4f}",
+                f"DRV:DP 1 {entry.large_ring:.4f}",
+                f"DRV:DP 2 {entry.small_ring:.4f}",
+                f"DRV:DP 3 {entry.coupler:.4f}",
+            ]
+        )
 
         # Apply the heater values
-        self._comm.query("DRV:U")
-
-        # Apply anti-hysteresis if needed
-        if self.anti_hyst_enabled:
-            self._antihyst()
+        self._apply_entry(entry, "DRV:U")
 
         return entry.wavelength
 
-    def _cycler_index(self, wavelength: float) -> float:
+    def _cycler_index(self, entry: CalibrationEntry) -> float:
         """Set wavelength using the laser's cycler index.
 
         Args:
-            wavelength: Target wavelength in nanometers.
-
-        Raises:
-            ValueError: If wavelength is outside the calibration range
+            entry: Calibration entry of the target wavelength.
 
         Returns:
             The actual wavelength that was set.
@@ -273,17 +296,42 @@ class TuneMode(__Calibrated):
             application.
 
         """
-        try:
-            entry: CalibrationEntry = self._calibration[wavelength]
-        except KeyError as e:
-            raise ValueError(
-                f"Wavelength {wavelength} not found in calibration table."
-            ) from e
+        self._apply_entry(entry, f"DRV:CYC:LOAD {entry.cycler_index}")
+
+        return entry.wavelength
 
-        self._comm.query(f"DRV:CYC:LOAD {entry.cycler_index}")
+    def _apply_entry(self, entry: CalibrationEntry, command: str) -> None:
+        """Send the command tuning the laser to a calibration entry.
 
-        # Apply anti-hysteresis if needed
-        if self.anti_hyst_enabled:
-            self._antihyst()
+        The command is followed by anti-hysteresis correction and, if auto-trigger
+        is enabled, a trigger pulse. On COMET lasers the correction is only needed
+        when the new entry is in a different mode than the previous one, so it is
+        skipped otherwise.
 
-        return entry.wavelength
+        Args:
+            entry: The calibration entry to apply.
+            command: The driver command applying the entry.
+
+        Raises:
+            LaserError: If the laser rejects the command. No anti-hysteresis
+                correction or trigger pulse is applied in that case.
+
+        """
+        antihyst: bool = self.anti_hyst_enabled and (
+            entry.mode_index is None or entry.mode_index != self._mode_index
+        )
+
+        self._comm.query(command)
+
+        if antihyst:
+            # The phase section voltage was just set from the calibration entry, so
+            # it does not have to be read back from the driver
+            self._antihyst(entry.phase_section)
+        # Without correction the mode is left unknown, so that the next tuning with
+        # correction enabled applies it even within the same mode
+        self._mode_index = entry.mode_index if self.anti_hyst_enabled else None
+
+        # The trigger is only sent once the laser has accepted the tuning, so a
+        # failed tuning never produces a pulse
+        if self._autoTrig:
+            self._laser.trigger_pulse()
@@ -6,6 +6,7 @@ from io import StringIO
 from unittest.mock import mock_open, patch
 
 from pychilaslasers.calibration.calibration_parsing import (
+    _load_shared_calibration,
     _parse_defaults_block,
     _parse_rows,
     load_calibration,
@@ -77,6 +78,9 @@ class TestCalibration:
         assert calibration.sweep_settings is None
         assert calibration.max_wl == 1555.0
         assert calibration.min_wl == 1551.0
+        assert calibration.wavelengths == [
+            e.wavelength for e in SAMPLE_CALIBRATION_ENTRIES
+        ]
 
     def test_calibration_iter(self):
         """Test __iter__ method."""
@@ -145,6 +149,27 @@ class TestCalibration:
         entry = calibration[1552.7]  # closest to 1552.0, but that's a mode hop
         assert entry.wavelength == 1553.0  # next closest non-mode-hop
 
+    @pytest.mark.parametrize(
+        "wavelength, expected",
+        [
+            (1551.0, 1551.0),  # lower edge
+            (1551.2, 1551.0),
+            (1553.5, 1554.0),  # tie resolved in file order
+            (1554.9, 1555.0),
+            (1555.0, 1555.0),  # upper edge
+        ],
+    )
+    def test_calibration_getitem_closest_match_bisect(self, wavelength, expected):
+        """Test __getitem__ closest match at the edges and between entries."""
+        calibration = Calibration(
+            model="ATLAS",
+            entries=SAMPLE_CALIBRATION_ENTRIES,
+            tune_settings=SAMPLE_TUNE_SETTING,
+            sweep_settings=None,
+        )
+
+        assert calibration[wavelength].wavelength == expected
+
     def test_calibration_getitem_key_error(self):
         """Test __getitem__ raises KeyError for out of range wavelength."""
         calibration = Calibration(
@@ -176,6 +201,39 @@ class TestCalibration:
         assert not entry == CalibrationEntry(
             1552.0, 11.0, 24.0, 33.0, 43.0, 2, False, 5
         )  # mode hop
+        # Closest match resolves to the same mode hop procedure
+        assert calibration.get_mode_hop_start(1552.2) is entry
+
+    def test_neighbour(self):
+        """Test stepping to the neighbouring calibrated wavelength."""
+        calibration = Calibration(
+            model="ATLAS",
+            entries=SAMPLE_CALIBRATION_ENTRIES,
+            tune_settings=SAMPLE_TUNE_SETTING,
+            sweep_settings=None,
+        )
+
+        assert calibration.neighbour(1553.0, 1) == 1554.0
+        assert calibration.neighbour(1553.0, -1) == 1552.0
+        assert calibration.neighbour(1553.0, 0) == 1552.0
+        # Closest match is used as the starting point
+        assert calibration.neighbour(1553.2, 0.1) == 1554.0
+
+    def test_neighbour_at_ends(self):
+        """Test that stepping past either end of the calibration raises."""
+        calibration = Calibration(
+            model="ATLAS",
+            entries=SAMPLE_CALIBRATION_ENTRIES,
+            tune_settings=SAMPLE_TUNE_SETTING,
+            sweep_settings=None,
+        )
+
+        with pytest.raises(ValueError):
+            calibration.neighbour(1555.0, 1)
+        with pytest.raises(ValueError):
+            calibration.neighbour(1551.0, -1)
+        with pytest.raises(KeyError):
+            calibration.neighbour(1556.0, -1)
 
     def test_get_mode_hop_start_without_mode_hop(self):
         """Test get_mode_hop_start when wavelength has no mode hop entry."""
@@ -293,6 +351,33 @@ anti_hyst_interval = [10.0]
         with pytest.raises(FileNotFoundError):
             load_calibration("nonexistent.csv")
 
+    def test_load_calibration_returns_new_object(self, tmp_path):
+        """Test that every load returns its own Calibration object."""
+        file = tmp_path / "calibration.csv"
+        file.write_text("10.0;20.0;30.0;40.0;1555.0;0\n11.0;21.0;31.0;41.0;1554.0;0\n")
+
+        first = load_calibration(file)
+        first.entries.clear()
+
+        assert len(load_calibration(file).entries) == 2
+
+    def test_shared_calibration_cached(self, tmp_path):
+        """Test that an unchanged file is parsed only once for Laser instances."""
+        file = tmp_path / "calibration.csv"
+        file.write_text("10.0;20.0;30.0;40.0;1555.0;0\n11.0;21.0;31.0;41.0;1554.0;0\n")
+
+        first = _load_shared_calibration(file)
+        assert _load_shared_calibration(str(file)) is first
+
+        file.write_text(
+            "10.0;20.0;30.0;40.0;1555.0;0\n"
+            "11.0;21.0;31.0;41.0;1554.0;0\n"
+            "12.0;22.0;32.0;42.0;1553.0;0\n"
+        )
+        reloaded = _load_shared_calibration(file)
+        assert reloaded is not first
+        assert len(reloaded.entries) == 3
+
     @pytest.mark.parametrize(
         "content",
         [
@@ -378,6 +463,14 @@ class TestCalibrationEdgeCases:
         entries = _parse_rows(f, "ATLAS")
         assert len(entries) == 0
 
+    def test_parse_rows_unknown_model_expects_mode_hop_column(self):
+        """Test that only ATLAS files may omit the mode hop column."""
+        content = "10.0;20.0;30.0;40.0;1555.0\n"
+
+        assert len(_parse_rows(StringIO(content), "ATLAS")) == 1
+        with pytest.raises(CalibrationError):
+            _parse_rows(StringIO(content), "UNKNOWN")
+
     def test_comet_mode_hop_tracking(self):
         """Test COMET mode hop tracking logic."""
         content = """
@@ -0,0 +1,287 @@
+"""Tests for the comm module."""
+
+import pytest
+from unittest.mock import patch
+
+from pychilaslasers.comm import Communication
+from pychilaslasers.constants import Constants
+from pychilaslasers.exceptions.laser_error import LaserError
+
+
+class FakeSerial:
+    """Minimal stand-in for `serial.Serial` that answers like the laser driver.
+
+    Every line written is answered with `0 <response>` where the response is looked
+    up in `responses` (empty by default). Commands listed in `errors` are answered
+    with an error reply instead.
+    """
+
+    def __init__(self, port=None, baudrate=None, timeout=None, **kwargs):
+        self.port = port
+        self.baudrate = baudrate
+        self.timeout = timeout
+        self.is_open = True
+        self.written: list[bytes] = []
+        self.responses: dict[str, str] = {}
+        self.errors: set[str] = set()
+        self._rx = bytearray()
+        self._prefix = True
+
+    def write(self, data: bytes) -> int:
+        self.written.append(data)
+        for line in data.decode("ascii").split("\r\n")[:-1]:
+            cmd = line.split(" ")[0]
+            if cmd == "SYST:SER:BAUD":
+                continue  # The driver switches baudrate without replying
+            if cmd == "SYST:COMM:PFX":
+                self._prefix = line.endswith("1")
+            if not self._prefix:
+                continue
+            if line in self.errors:
+                self._rx += b"1 E0001: error\r\n"
+            else:
+                self._rx += f"0 {self.responses.get(line, '')}\r\n".encode("ascii")
+        return len(data)
+
+    @property
+    def in_waiting(self) -> int:
+        return len(self._rx)
+
+    def read(self, size: int = 1) -> bytes:
+        data = bytes(self._rx[:size])
+        del self._rx[:size]
+        return data
+
+    def readline(self) -> bytes:
+        end = self._rx.find(b"\n") + 1 or len(self._rx)
+        return self.read(end)
+
+    def flush(self) -> None:
+        pass
+
+    def reset_input_buffer(self) -> None:
+        self._rx.clear()
+
+    def open(self) -> None:
+        self.is_open = True
+
+    def close(self) -> None:
+        self.is_open = False
+
+
+@pytest.fixture
+def comm():
+    """Communication object connected to a FakeSerial port."""
+    with (
+        patch("pychilaslasers.comm.serial.Serial", FakeSerial),
+        patch("pychilaslasers.comm.atexit.register"),
+        patch("pychilaslasers.comm.signal.signal"),
+        patch("pychilaslasers.comm.sleep"),
+    ):
+        comm = Communication("COM1")
+    comm._serial.written.clear()
+    yield comm
+    comm._serial.close()
+
+
+class TestQuery:
+    """Test sending commands and reading replies."""
+
+    def test_query_returns_response(self, comm):
+        """Test that the return code is stripped from the reply."""
+        comm._serial.responses["SYST:STAT?"] = "1"
+
+        assert comm.query("SYST:STAT?") == "1"
+
+    def test_query_raises_laser_error(self, comm):
+        """Test that a nonzero return code raises a LaserError."""
+        comm._serial.errors.add("SYST:STAT 3")
+
+        with pytest.raises(LaserError):
+            comm.query("SYST:STAT 3")
+
+
+class TestQueryBatch:
+    """Test sending multiple commands in a single transmission."""
+
+    def test_query_batch_single_write(self, comm):
+        """Test that all commands are written at once and replies kept in order."""
+        comm._serial.responses["TEC:TEMP?"] = "25.0"
+        comm._serial.responses["LSR:ILEV?"] = "280.0"
+
+        replies = comm.query_batch(["TEC:TEMP?", "LSR:STAT 1", "LSR:ILEV?"])
+
+        assert replies == ["25.0", "", "280.0"]
+        assert comm._serial.written == [b"TEC:TEMP?\r\nLSR:STAT 1\r\nLSR:ILEV?\r\n"]
+
+    def test_query_batch_bounded_in_flight(self, comm):
+        """Test that large batches are streamed with a limited number in flight."""
+        commands = [f"DRV:D? {i}" for i in range(10)]
+        for i, command in enumerate(commands):
+            comm._serial.responses[command] = str(i)
+
+        with patch.object(Constants, "BATCH_PIPELINE_DEPTH", 4):
+            replies = comm.query_batch(commands)
+
+        assert replies == [str(i) for i in range(10)]
+        assert b"".join(comm._serial.written) == b"".join(
+            f"{command}\r\n".encode("ascii") for command in commands
+        )
+        assert all(data.count(b"\r\n") <= 4 for data in comm._serial.written)
+        assert len(comm._serial.written) > 1
+
+    def test_query_batch_empty(self, comm):
+        """Test that an empty batch does not touch the serial connection."""
+        assert comm.query_batch([]) == []
+        assert comm._serial.written == []
+
+    def test_query_batch_error_keeps_sync(self, comm):
+        """Test that all replies are consumed before an error is raised."""
+        comm._serial.errors.add("LSR:STAT 3")
+        comm._serial.responses["TEC:TEMP?"] = "25.0"
+
+        with pytest.raises(LaserError):
+            comm.query_batch(["LSR:STAT 3", "LSR:STAT 1"])
+
+        assert comm.query("TEC:TEMP?") == "25.0"
+
+
+class TestReadline:
+    """Test reading replies from the serial connection."""
+
+    def test_readline_keeps_remaining_replies(self, comm):
+        """Test that bytes past the first line are kept for the next read."""
+        comm._serial._rx += b"0 first\r\n0 second\r\n"
+
+        assert comm._readline() == b"0 first\r\n"
+        assert comm._serial.in_waiting == 0
+        assert comm._readline() == b"0 second\r\n"
+
+    def test_readline_timeout(self, comm):
+        """Test that a partial line is returned when no more data arrives."""
+        comm._serial._rx += b"0 partial"
+
+        assert comm._readline() == b"0 partial"
+        assert comm._readline() == b""
+
+
+class TestBaudrate:
+    """Test switching the baudrate of the connection."""
+
+    def test_baudrate_switch_keeps_port_open(self, comm):
+        """Test that the port is reconfigured in place instead of reopened."""
+        with (
+            patch.object(comm._serial, "close") as close,
+            patch.object(comm._serial, "open") as open_,
+            patch.object(comm._serial, "reset_input_buffer") as reset_input,
+        ):
+            comm.baudrate = 115200
+
+        close.assert_not_called()
+        open_.assert_not_called()
+        reset_input.assert_called_once()
+        assert comm._serial.baudrate == 115200
+        assert comm._serial.written == [b"SYST:SER:BAUD 115200\r\n"]
+
+    def test_input_during_switch_discarded(self, comm):
+        """Test that bytes arriving while the driver switches do not desync replies."""
+
+        def late_bytes(seconds):
+            # A stale reply at the old baudrate and line noise arrive after the
+            # port has already been reconfigured
+            comm._serial._rx += b"0 57600\r\n\x00\xff"
+
+        comm._serial.responses["SYST:STAT?"] = "1"
+        with patch("pychilaslasers.comm.sleep", side_effect=late_bytes) as sleep:
+            comm.baudrate = 115200
+
+        sleep.assert_called_once_with(Constants.BAUDRATE_SWITCH_SETTLE_MS / 1000)
+        assert comm.query("SYST:STAT?") == "1"
+
+    def test_fallback_tries_requested_baudrate_first(self):
+        """Test the order of baudrates tried when the laser does not answer."""
+        tried: list[int] = []
+
+        class LaserAt9600(FakeSerial):
+            laser_baudrate = 9600
+
+            def write(self, data: bytes) -> int:
+                if data.startswith(b"SYST:COMM:PFX"):
+                    tried.append(self.baudrate)
+                if self.baudrate != self.laser_baudrate:
+                    return len(data)  # Nothing is understood at the wrong baudrate
+                if data.startswith(b"SYST:SER:BAUD "):
+                    self.laser_baudrate = int(data.split()[1])
+                return super().write(data)
+
+        with (
+            patch("pychilaslasers.comm.serial.Serial", LaserAt9600),
+            patch("pychilaslasers.comm.atexit.register"),
+            patch("pychilaslasers.comm.signal.signal"),
+            patch("pychilaslasers.comm.sleep"),
+        ):
+            comm = Communication("COM1", baudrate=115200)
+
+        assert tried == [57600, 115200, 460800, 9600]
+        assert comm._serial.baudrate == comm._serial.laser_baudrate == 115200
+        comm._serial.close()
+
+
+class TestSemicolonReplace:
+    """Test replacing repeated commands with a semicolon."""
+
+    def test_repeated_command_replaced(self, comm):
+        """Test that a repeated cycler command is sent as a semicolon."""
+        assert comm._semicolon_replace("DRV:CYC:PUT 1 2") == "DRV:CYC:PUT 1 2"
+        assert comm._semicolon_replace("DRV:CYC:PUT 3 4") == "; 3 4"
+        assert comm._semicolon_replace("DRV:CYC:GET?") == "DRV:CYC:GET?"
+        assert comm._semicolon_replace("DRV:CYC:GET?") == ";"
+
+    def test_other_command_not_replaced(self, comm):
+        """Test that commands not in the semicolon list are always sent in full."""
+        assert comm._semicolon_replace("TEC:TEMP?") == "TEC:TEMP?"
+        assert comm._semicolon_replace("TEC:TEMP?") == "TEC:TEMP?"
+
+
+class TestLowLatency:
+    """Test enabling low latency mode on the serial port."""
+
+    def test_low_latency_falls_back_to_latency_timer(self, comm, tmp_path):
+        """Test that the sysfs latency timer is used if the ioctl is unsupported."""
+        timer = tmp_path / "COM1" / "latency_timer"
+        timer.parent.mkdir()
+        timer.write_text("16")
+
+        with patch("pychilaslasers.comm._USB_SERIAL_SYSFS", tmp_path):
+            comm.low_latency = True
+
+        assert comm.low_latency
+        assert timer.read_text() == "1"
+
+    def test_low_latency_unavailable(self, comm, tmp_path):
+        """Test that low latency stays disabled if it can not be set at all."""
+        with patch("pychilaslasers.comm._USB_SERIAL_SYSFS", tmp_path):
+            comm.low_latency = True
+
+        assert not comm.low_latency
+
+
+class TestFlush:
+    """Test when the serial output is flushed."""
+
+    def test_no_flush_when_waiting_for_reply(self, comm):
+        """Test that reading the reply is not preceded by a blocking flush."""
+        with patch.object(comm._serial, "flush") as flush:
+            comm.query("TEC:TEMP?")
+            comm.query_batch(["TEC:TEMP?", "LSR:ILEV?"])
+
+        flush.assert_not_called()
+
+    def test_flush_without_prefix_mode(self, comm):
+        """Test that commands are flushed when no reply is expected."""
+        comm.prefix_mode = False
+        with patch.object(comm._serial, "flush") as flush:
+            comm.query("LSR:STAT 1")
+            comm.query_batch(["LSR:STAT 1", "LSR:STAT 0"])
+
+        assert flush.call_count == 2
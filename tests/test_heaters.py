@@ -0,0 +1,71 @@
+"""Tests for the heater components."""
+
+from unittest.mock import Mock, patch
+
+from pychilaslasers.laser_components.heaters import (
+    HeaterChannel,
+    LargeRing,
+    PhaseSection,
+)
+from pychilaslasers.modes.manual_mode import ManualMode
+
+
+def test_limits_read_in_one_transmission():
+    """Test that the limits and unit of a heater are fetched in a single batch."""
+    laser = Mock()
+    laser.comm.query_batch.return_value = ["0.0", "10.0", " V "]
+
+    heater = LargeRing(laser)
+
+    laser.comm.query_batch.assert_called_once_with(
+        ["DRV:LIM:MIN? 2", "DRV:LIM:MAX? 2", "DRV:UNIT? 2"]
+    )
+    assert (heater.min_value, heater.max_value, heater.unit) == (0.0, 10.0, "V")
+
+
+def test_set_driver_value_accepts_channel_enum():
+    """Test that a HeaterChannel is sent as its channel number."""
+    manual = ManualMode.__new__(ManualMode)
+    manual._comm = Mock()
+
+    manual.set_driver_value(HeaterChannel.RING_LARGE, 1.5)
+    manual.set_driver_value(1, 2.5)
+
+    assert [c.args[0] for c in manual._comm.query.call_args_list] == [
+        "DRV:D 2 1.5000",
+        "DRV:D 1 2.5000",
+    ]
+
+
+def test_antihyst_ramp():
+    """Test the phase section ramp values, clamping and waits between steps."""
+    laser = Mock()
+    laser._manual_mode.phase_section.min_value = 0.0
+    laser._manual_mode.phase_section.max_value = 10.0
+    antihyst = PhaseSection.get_antihyst_method(
+        laser, voltage_steps=[200.0, 20.0, 0.0], time_steps=[5.0]
+    )
+
+    with patch("pychilaslasers.laser_components.heaters.phase_section.sleep") as sleep:
+        antihyst(4.0)
+
+    assert [c.args[0] for c in laser.comm.query.call_args_list] == [
+        "DRV:D 0 10.0000",  # sqrt(216) is clamped to the maximum
+        "DRV:D 0 6.0000",
+        "DRV:D 0 4.0000",
+    ]
+    assert [c.args[0] for c in sleep.call_args_list] == [0.005, 0.005]
+
+
+def test_antihyst_default_time_steps():
+    """Test that the default ramp waits use the time half of TUNE_ANTI_HYST."""
+    laser = Mock()
+    laser._manual_mode.phase_section.min_value = 0.0
+    laser._manual_mode.phase_section.max_value = 10.0
+    antihyst = PhaseSection.get_antihyst_method(laser)
+
+    with patch("pychilaslasers.laser_components.heaters.phase_section.sleep") as sleep:
+        antihyst(4.0)
+
+    # TUNE_ANTI_HYST is ([35.0, 0.0], [10.0]): one 10 ms wait, not 35 ms
+    assert [c.args[0] for c in sleep.call_args_list] == [0.01]
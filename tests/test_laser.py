@@ -0,0 +1,87 @@
+"""Tests for the laser."""
+
+import threading
+from contextlib import ExitStack
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+import pytest
+
+from pychilaslasers.exceptions.calibration_error import CalibrationError
+from pychilaslasers.laser import Laser
+
+
+@pytest.fixture
+def patched():
+    """Patch the connection and components created by Laser.__init__.
+
+    Yields a namespace with the mock connection (`comm`), the patched
+    `Communication` class (`connect`), calibration file parser (`parse`) and
+    `Laser.calibrate` method (`calibrate`).
+    """
+    comm = Mock()
+    comm.query.return_value = "Chilas laser"
+    with ExitStack() as stack:
+        for name in (
+            "System",
+            "TEC",
+            "Diode",
+            "EnclosureTemp",
+            "CPU",
+            "PhotoDiode",
+            "ManualMode",
+        ):
+            stack.enter_context(patch(f"pychilaslasers.laser.{name}"))
+        yield SimpleNamespace(
+            comm=comm,
+            connect=stack.enter_context(
+                patch("pychilaslasers.laser.Communication", return_value=comm)
+            ),
+            parse=stack.enter_context(
+                patch("pychilaslasers.laser._load_shared_calibration")
+            ),
+            calibrate=stack.enter_context(patch.object(Laser, "calibrate")),
+        )
+
+
+class TestCalibrationHandoff:
+    """Test parsing the calibration file while the connection is set up."""
+
+    def test_calibration_parsed_during_connection(self, patched):
+        """Test that parsing starts before connecting and its result is used."""
+        parse_started = threading.Event()
+        calibration = Mock()
+
+        def parse(file_path):
+            parse_started.set()
+            return calibration
+
+        def connect(**kwargs):
+            # Parsing runs in the background, so it is not waiting on the connection
+            assert parse_started.wait(timeout=1)
+            return patched.comm
+
+        patched.parse.side_effect = parse
+        patched.connect.side_effect = connect
+
+        Laser("COM1", "calibration.csv")
+
+        patched.parse.assert_called_once_with("calibration.csv")
+        patched.calibrate.assert_called_once_with(calibration_object=calibration)
+
+    def test_parse_error_closes_connection(self, patched):
+        """Test that a failed parse is raised after closing the connection."""
+        patched.parse.side_effect = CalibrationError("Incorrect file format")
+
+        with pytest.raises(CalibrationError):
+            Laser("COM1", "calibration.csv")
+
+        patched.comm.close_connection.assert_called_once()
+        patched.calibrate.assert_not_called()
+
+    def test_no_calibration_file(self, patched):
+        """Test that nothing is parsed without a calibration file."""
+        Laser("COM1")
+
+        patched.parse.assert_not_called()
+        patched.calibrate.assert_not_called()
@@ -0,0 +1,37 @@
+"""Tests for the sensor components."""
+
+from unittest.mock import Mock
+
+from pychilaslasers.laser_components.sensors import (
+    CPU,
+    EnclosureTemp,
+    PhotoDiode,
+    PhotoDiodeChannel,
+)
+
+
+def test_temp_read_in_one_transmission():
+    """Test that the sensor is selected and read in a single batch."""
+    laser = Mock()
+    laser.comm.query_batch.return_value = ["", "31.5"]
+
+    for sensor in (EnclosureTemp(laser), CPU(laser)):
+        assert sensor.temp == 31.5
+
+    laser.comm.query_batch.assert_called_with(["SYST:TEMP:NSEL 1", "SYST:TEMP:TEMP?"])
+    laser.comm.query.assert_not_called()
+
+
+def test_photodiode_queries_own_channel():
+    """Test that the readout and unit are queried for the photodiode's channel."""
+    laser = Mock()
+    laser.comm.query.side_effect = ["0.25", "mA"]
+
+    photodiode = PhotoDiode(laser, PhotoDiodeChannel.PD2)
+
+    assert photodiode.readout == 0.25
+    assert photodiode.unit == "mA"
+    assert [c.args[0] for c in laser.comm.query.call_args_list] == [
+        "MEAS:M? 1",
+        "MEAS:UNIT? 1",
+    ]
@@ -0,0 +1,125 @@
+"""Tests for the sweep mode."""
+
+import pytest
+from unittest.mock import Mock, patch
+
+from pychilaslasers.calibration import (
+    Calibration,
+    CalibrationEntry,
+    Defaults,
+    TuneSettings,
+)
+from pychilaslasers.modes.sweep_mode import SweepMode
+
+
+@pytest.fixture
+def sweep():
+    """SweepMode with a calibrated range of 1550 - 1560 nm and a mocked connection."""
+    sweep = SweepMode.__new__(SweepMode)
+    sweep._min_wl = 1550.0
+    sweep._max_wl = 1560.0
+    sweep._comm = Mock()
+    return sweep
+
+
+class TestSweepRange:
+    """Test validation of the sweep range."""
+
+    @pytest.mark.parametrize("wavelength", [1549.9, 1560.1])
+    def test_start_wavelength_out_of_range(self, sweep, wavelength):
+        """Test that an invalid start wavelength is rejected without a query."""
+        with pytest.raises(ValueError):
+            sweep.start_wavelength = wavelength
+
+        sweep._comm.query.assert_not_called()
+
+    @pytest.mark.parametrize("wavelength", [1549.9, 1560.1])
+    def test_end_wavelength_out_of_range(self, sweep, wavelength):
+        """Test that an invalid end wavelength is rejected without a query."""
+        with pytest.raises(ValueError):
+            sweep.end_wavelength = wavelength
+
+        sweep._comm.query.assert_not_called()
+
+    @pytest.mark.parametrize(
+        ("start", "end", "message"),
+        [
+            (1561.0, 1555.0, "Range must be in"),
+            (1555.0, 1549.0, "Range must be in"),
+            (1555.0, 1555.0, "cannot be less than"),
+            (1552.0, 1555.0, "cannot be less than"),
+        ],
+    )
+    def test_range_invalid(self, sweep, start, end, message):
+        """Test that invalid ranges are rejected without a query."""
+        with pytest.raises(ValueError, match=message):
+            sweep.range = (start, end)
+
+        sweep._comm.query.assert_not_called()
+
+
+class TestWaitUntilDone:
+    """Test waiting for a sweep to finish."""
+
+    def test_returns_when_cycler_stops(self, sweep):
+        """Test that waiting ends as soon as the cycler reports it stopped."""
+        sweep._comm.query.side_effect = ["1", "1", "0"]
+
+        with patch("pychilaslasers.modes.sweep_mode.sleep") as sleep:
+            assert sweep.wait_until_done(poll_interval=0.5)
+
+        assert sleep.call_count == 2
+        sleep.assert_called_with(0.5)
+        sweep._comm.query.assert_called_with("DRV:CYC:RUN?")
+
+    def test_timeout_expires(self, sweep):
+        """Test that False is returned when the cycler is still running."""
+        sweep._comm.query.return_value = "1"
+
+        with (
+            patch("pychilaslasers.modes.sweep_mode.sleep") as sleep,
+            patch(
+                "pychilaslasers.modes.sweep_mode.monotonic",
+                side_effect=[0.0, 0.5, 1.5],
+            ),
+        ):
+            assert not sweep.wait_until_done(timeout=1.0)
+
+        sleep.assert_called_once()
+
+    def test_idle_cycler_does_not_sleep(self, sweep):
+        """Test that an idle cycler returns immediately without sleeping."""
+        sweep._comm.query.return_value = "0"
+
+        with patch("pychilaslasers.modes.sweep_mode.sleep") as sleep:
+            assert sweep.wait_until_done(timeout=1.0)
+
+        sleep.assert_not_called()
+        sweep._comm.query.assert_called_once_with("DRV:CYC:RUN?")
+
+
+class TestSweepPoints:
+    """Test listing the wavelengths of a sweep."""
+
+    def test_get_points(self, sweep):
+        """Test that the points are the table entries within the current span."""
+        wavelengths = [1560.0, 1558.0, 1556.0, 1556.0, 1554.0, 1552.0, 1550.0]
+        sweep._calibration = Calibration(
+            entries=[
+                CalibrationEntry(wl, 1.0, 2.0, 3.0, 4.0, 1, i == 2, i)
+                for i, wl in enumerate(wavelengths)
+            ],
+            tune_settings=TuneSettings(
+                current=280.0,
+                tec_temp=25.0,
+                anti_hyst_voltages=[35.0, 0.0],
+                anti_hyst_times=[10.0],
+                method=Defaults.TUNE_METHOD,
+            ),
+            sweep_settings=None,
+        )
+        sweep._comm.query.return_value = "1 5"
+
+        assert sweep.get_points() == [1558.0, 1556.0, 1556.0, 1554.0, 1552.0]
+        sweep._comm.query.assert_called_once_with("DRV:CYC:SPAN?")
+        assert sweep.range == (1558.0, 1552.0)
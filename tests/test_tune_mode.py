@@ -0,0 +1,216 @@
+"""Tests for the tune mode."""
+
+import pytest
+from unittest.mock import Mock
+
+from pychilaslasers.calibration import (
+    Calibration,
+    CalibrationEntry,
+    TuneMethod,
+    TuneSettings,
+)
+from pychilaslasers.exceptions.laser_error import LaserError
+from pychilaslasers.laser import Laser
+from pychilaslasers.modes.tune_mode import TuneMode
+
+COMET_ENTRIES = [
+    CalibrationEntry(1555.0, 10.0, 20.0, 30.0, 40.0, 1, False, 0),
+    CalibrationEntry(1554.0, 11.0, 21.0, 31.0, 41.0, 1, False, 1),
+    CalibrationEntry(1553.0, 12.0, 22.0, 32.0, 42.0, 2, True, 2),  # mode hop
+    CalibrationEntry(1553.0, 13.0, 23.0, 33.0, 43.0, 2, False, 3),
+    CalibrationEntry(1552.0, 14.0, 24.0, 34.0, 44.0, 2, False, 4),
+]
+
+
+@pytest.fixture
+def tune():
+    """TuneMode on a COMET calibration with a mocked laser."""
+    calibration = Calibration(
+        entries=COMET_ENTRIES,
+        tune_settings=TuneSettings(
+            current=280.0,
+            tec_temp=25.0,
+            anti_hyst_voltages=[35.0, 0.0],
+            anti_hyst_times=[10.0],
+            method=TuneMethod.CYCLER,
+        ),
+        sweep_settings=None,
+        model="COMET",
+    )
+    return TuneMode(Mock(), calibration)
+
+
+@pytest.fixture
+def laser(tune):
+    """Laser with a mocked connection, using the tune mode fixture."""
+    laser = Laser.__new__(Laser)
+    laser._comm = Mock()
+    laser._tune_mode = tune
+    return laser
+
+
+class TestTuning:
+    """Test the commands sent when tuning to a calibration entry."""
+
+    def test_preload_pipelined_before_update(self, tune):
+        """Test that the heater values are pipelined and applied afterwards."""
+        tune._pre_load_from_file(tune._calibration[1555.0])
+
+        tune._comm.query_batch.assert_called_once_with(
+            [
+                "DRV:DP 0 10.0000",
+                "DRV:DP 1 20.0000",
+                "DRV:DP 2 30.0000",
+                "DRV:DP 3 40.0000",
+            ]
+        )
+        tune._comm.query.assert_called_once_with("DRV:U")
+
+    def test_rejected_preload_not_applied(self, tune):
+        """Test that the heater values are not applied when a preload fails."""
+        tune._comm.query_batch.side_effect = LaserError("E0001", "error")
+
+        with pytest.raises(LaserError):
+            tune._pre_load_from_file(tune._calibration[1555.0])
+
+        tune._comm.query.assert_not_called()
+        tune._antihyst.assert_not_called()
+
+
+class TestRepeatedTuning:
+    """Test tuning to the wavelength the laser is already at."""
+
+    def test_same_entry_only_triggers(self, tune):
+        """Test that tuning to the current entry only sends the trigger pulse."""
+        tune._autoTrig = True
+        tune.wavelength = 1554.0
+        tune._comm.reset_mock()
+        tune._laser.reset_mock()
+
+        tune.wavelength = 1554.02
+
+        tune._comm.query_batch.assert_not_called()
+        tune._comm.query.assert_not_called()
+        tune._laser.trigger_pulse.assert_called_once()
+
+    def test_same_entry_after_power_cycle(self, tune, laser):
+        """Test that a power cycle makes the same wavelength be applied again."""
+        tune.wavelength = 1554.0
+        laser.turn_off()
+        laser.turn_on()
+        tune._comm.reset_mock()
+
+        tune.wavelength = 1554.0
+
+        tune._comm.query.assert_called_once_with("DRV:CYC:LOAD 1")
+
+
+class TestAntiHysteresis:
+    """Test when anti-hysteresis correction is applied."""
+
+    def test_antihyst_only_on_mode_change(self, tune):
+        """Test that tuning within the same mode skips anti-hysteresis."""
+        tune._pre_load_from_file(tune._calibration[1555.0])
+        tune._pre_load_from_file(tune._calibration[1554.0])
+        tune._cycler_index(tune._calibration[1552.0])
+
+        assert tune._antihyst.call_count == 2
+        tune._antihyst.assert_called_with(14.0)
+
+    def test_antihyst_after_power_cycle(self, tune, laser):
+        """Test that the first tuning after a power cycle applies anti-hysteresis."""
+        tune._cycler_index(tune._calibration[1555.0])
+        laser.turn_off()
+        laser.turn_on()
+        tune._cycler_index(tune._calibration[1554.0])
+
+        assert tune._antihyst.call_count == 2
+
+    def test_antihyst_disabled(self, tune):
+        """Test that anti-hysteresis is not applied when disabled."""
+        tune.anti_hyst_enabled = False
+        tune._pre_load_from_file(tune._calibration[1555.0])
+        tune._pre_load_from_file(tune._calibration[1552.0])
+
+        tune._antihyst.assert_not_called()
+
+    def test_antihyst_after_enabling(self, tune):
+        """Test that enabling anti-hysteresis corrects the next tuning in the mode."""
+        tune._min_wl, tune._max_wl = 1552.0, 1555.0
+        tune.toggle_antihyst(False)
+        tune.wavelength = 1555.0
+        tune.toggle_antihyst()
+        tune.wavelength = 1555.0
+        tune.wavelength = 1554.0
+
+        tune._antihyst.assert_called_once_with(10.0)
+
+    def test_antihyst_after_disabled_tuning(self, tune):
+        """Test that a tuning without correction does not count as corrected."""
+        tune._cycler_index(tune._calibration[1555.0])
+        tune.anti_hyst_enabled = False
+        tune._cycler_index(tune._calibration[1552.0])
+        tune._cycler_index(tune._calibration[1554.0])
+        tune.anti_hyst_enabled = True
+        tune._cycler_index(tune._calibration[1555.0])
+
+        assert tune._antihyst.call_count == 2
+
+
+class TestAutoTrigger:
+    """Test sending the trigger pulse after tuning."""
+
+    def test_trigger_after_tuning(self, tune):
+        """Test that the trigger pulse follows an accepted tuning."""
+        tune._autoTrig = True
+        tune._mode_index = 1
+        tune._cycler_index(tune._calibration[1554.0])
+
+        tune._comm.query.assert_called_once_with("DRV:CYC:LOAD 1")
+        tune._laser.trigger_pulse.assert_called_once()
+
+    def test_no_trigger_on_failed_tuning(self, tune):
+        """Test that no trigger is sent when the laser rejects the tuning."""
+        tune._autoTrig = True
+        tune._mode_index = 1
+        tune._comm.query.side_effect = LaserError("E0001", "error")
+
+        with pytest.raises(LaserError):
+            tune._cycler_index(tune._calibration[1554.0])
+
+        tune._comm.query.assert_called_once_with("DRV:CYC:LOAD 1")
+        tune._laser.trigger_pulse.assert_not_called()
+
+    def test_trigger_after_antihyst(self, tune):
+        """Test that the trigger is sent separately after anti-hysteresis."""
+        tune._autoTrig = True
+        tune._cycler_index(tune._calibration[1552.0])
+
+        tune._comm.query.assert_called_once_with("DRV:CYC:LOAD 4")
+        tune._antihyst.assert_called_once_with(14.0)
+        tune._laser.trigger_pulse.assert_called_once()
+
+
+class TestRelativeTuning:
+    """Test tuning relative to the current wavelength."""
+
+    def test_small_step_moves_to_neighbour(self, tune):
+        """Test that a step smaller than the spacing moves to the next wavelength."""
+        tune.wavelength = 1555.0
+        tune._comm.reset_mock()
+
+        assert tune.set_wl_relative(-0.1) == 1554.0
+        tune._comm.query.assert_called_once_with("DRV:CYC:LOAD 1")
+
+    def test_small_step_skips_mode_hop_entries(self, tune):
+        """Test that stepping up lands on the next wavelength, not a mode hop entry."""
+        tune.wavelength = 1552.0
+
+        assert tune.set_wl_relative(0.1) == 1553.0
+
+    def test_step_past_end_raises(self, tune):
+        """Test that stepping below the lowest wavelength does not wrap around."""
+        tune.wavelength = 1552.0
+
+        with pytest.raises(ValueError):
+            tune.set_wl_relative(0.0)